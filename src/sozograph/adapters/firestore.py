@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import Any, Dict, List, Optional, Union
 
 from ..interaction import Interaction
-from ..utils import parse_ts, safe_stringify, sha256_json, pick_first
+from ..utils import utcnow, parse_ts, safe_stringify, fast_id, pick_first
 
 
 # Common Firestore field names we try first for text & timestamps
@@ -50,17 +50,18 @@ def firestore_to_interaction(
     text_val = pick_first(doc, _TEXT_FIELDS)
     if text_val is None:
         text_val = safe_stringify(doc)
+    elif not isinstance(text_val, str):
+        text_val = str(text_val)
 
-    # Determine id
+    # Determine id (doc fields may hold non-str ids)
     _id = doc_id or doc.get("id") or doc.get("_id")
-    if not _id:
-        _id = sha256_json(doc)[:16]
+    _id = str(_id) if _id else fast_id(doc)
 
     return Interaction(
-        id=str(_id),
-        ts=ts or None,
+        id=_id,
+        ts=ts or utcnow(),
         type="firestore",
-        text=str(text_val),
+        text=text_val,
         source=source,
         data=doc,
     )
@@ -78,27 +79,15 @@ def firestore_batch_to_interactions(
     - list of document dicts
     - dict mapping {doc_id: doc_dict}
     """
-    interactions: List[Interaction] = []
-
     if isinstance(docs, dict):
-        for doc_id, doc in docs.items():
-            interactions.append(
-                firestore_to_interaction(
-                    doc,
-                    source=f"firestore:{collection_path}/{doc_id}"
-                    if collection_path
-                    else None,
-                    doc_id=str(doc_id),
-                )
-            )
-        return interactions
-
-    for doc in docs:
-        interactions.append(
+        return [
             firestore_to_interaction(
                 doc,
-                source=f"firestore:{collection_path}" if collection_path else None,
+                source=f"firestore:{collection_path}/{doc_id}" if collection_path else None,
+                doc_id=str(doc_id),
             )
-        )
+            for doc_id, doc in docs.items()
+        ]
 
-    return interactions
+    source = f"firestore:{collection_path}" if collection_path else None
+    return [firestore_to_interaction(doc, source=source) for doc in docs]
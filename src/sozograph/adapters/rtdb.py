@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import Any, Dict, List, Optional, Union
 
 from ..interaction import Interaction
-from ..utils import parse_ts, safe_stringify, sha256_json, pick_first
+from ..utils import utcnow, parse_ts, safe_stringify, fast_id, pick_first
 
 
 # Common timestamp-like fields in RTDB nodes
@@ -36,17 +36,18 @@ def rtdb_to_interaction(
     if isinstance(value, dict):
         ts = parse_ts(pick_first(value, _TS_FIELDS))
 
-    # Text representation
-    text_val = safe_stringify(value)
+    # Text representation (scalars need no structural walk)
+    if value is None or isinstance(value, (bool, int, float)):
+        text_val = str(value)
+    else:
+        text_val = safe_stringify(value)
 
-    # Stable id
-    _id = node_id or (path.replace("/", "_") if path else None)
-    if not _id:
-        _id = sha256_json({"path": path, "value": value})[:16]
+    # Stable id: node id, else the path; only hash the (possibly large) value without either
+    _id = node_id or (path.replace("/", "_") if path else None) or fast_id(value)
 
     return Interaction(
-        id=str(_id),
-        ts=ts or None,
+        id=_id,
+        ts=ts or utcnow(),
         type="rtdb",
         text=text_val,
         source=f"rtdb:{path}" if path else None,
@@ -66,26 +67,20 @@ def rtdb_batch_to_interactions(
     - Lists are enumerated by index
     """
 
-    interactions: List[Interaction] = []
+    # Child paths are "<base_path>/<key>", or just "<key>" without a base path.
+    prefix = f"{base_path}/" if base_path else ""
 
     if isinstance(snapshot, list):
-        for idx, value in enumerate(snapshot):
-            path = f"{base_path}/{idx}" if base_path else str(idx)
-            interactions.append(
-                rtdb_to_interaction(value, path=path)
-            )
-        return interactions
+        return [
+            rtdb_to_interaction(value, path=prefix + str(idx))
+            for idx, value in enumerate(snapshot)
+        ]
 
     if isinstance(snapshot, dict):
-        for key, value in snapshot.items():
-            path = f"{base_path}/{key}" if base_path else str(key)
-            interactions.append(
-                rtdb_to_interaction(value, path=path, node_id=str(key))
-            )
-        return interactions
+        return [
+            rtdb_to_interaction(value, path=prefix + str(key), node_id=str(key))
+            for key, value in snapshot.items()
+        ]
 
     # Fallback: single scalar value
-    interactions.append(
-        rtdb_to_interaction(snapshot, path=base_path)
-    )
-    return interactions
+    return [rtdb_to_interaction(snapshot, path=base_path)]
@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import Any, Dict, List, Optional, Union
 
 from ..interaction import Interaction
-from ..utils import parse_ts, safe_stringify, sha256_json, pick_first
+from ..utils import utcnow, parse_ts, safe_stringify, fast_id, pick_first
 
 
 _TEXT_FIELDS = (
@@ -46,20 +46,22 @@ def supabase_row_to_interaction(
     text_val = pick_first(row, _TEXT_FIELDS)
     if text_val is None:
         text_val = safe_stringify(row)
+    elif not isinstance(text_val, str):
+        text_val = str(text_val)
 
+    # Row columns may hold non-str ids (e.g. bigint primary keys)
     _id = row_id or row.get("id") or row.get("_id")
-    if not _id:
-        _id = sha256_json(row)[:16]
+    _id = str(_id) if _id else fast_id(row)
 
     src = source
     if not src and table:
         src = f"supabase:{table}"
 
     return Interaction(
-        id=str(_id),
-        ts=ts or None,
+        id=_id,
+        ts=ts or utcnow(),
         type="supabase",
-        text=str(text_val),
+        text=text_val,
         source=src,
         data=row,
         meta={"table": table} if table else {},
@@ -78,26 +80,16 @@ def supabase_batch_to_interactions(
     - list of rows
     - dict mapping {row_id: row_dict}
     """
-    interactions: List[Interaction] = []
-
     if isinstance(rows, dict):
-        for row_id, row in rows.items():
-            interactions.append(
-                supabase_row_to_interaction(
-                    row,
-                    table=table,
-                    source=f"supabase:{table}:{row_id}" if table else None,
-                    row_id=str(row_id),
-                )
-            )
-        return interactions
-
-    for row in rows:
-        interactions.append(
+        return [
             supabase_row_to_interaction(
                 row,
                 table=table,
-                source=f"supabase:{table}" if table else None,
+                source=f"supabase:{table}:{row_id}" if table else None,
+                row_id=str(row_id),
             )
-        )
-    return interactions
+            for row_id, row in rows.items()
+        ]
+
+    source = f"supabase:{table}" if table else None
+    return [supabase_row_to_interaction(row, table=table, source=source) for row in rows]
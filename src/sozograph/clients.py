@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import importlib.util
+import threading
+from typing import Any
+
+from google import genai
+from google.genai import types
+
+# One client per API key, shared by every Extractor / FallbackSummarizer in the process,
+# so HTTP connections (and their TLS sessions) are reused across instances and ingests.
+_CLIENT_CACHE: dict[str, genai.Client] = {}
+_CLIENT_LOCK = threading.Lock()
+
+# httpx keeps idle connections for only 5s by default, so consecutive ingests would
+# re-handshake; keep enough warm connections for SOZOGRAPH_MAX_CONCURRENCY fan-out.
+_KEEPALIVE_CONNECTIONS = 32
+_MAX_CONNECTIONS = 64
+_KEEPALIVE_EXPIRY_S = 60.0
+
+
+def _httpx_client_args() -> dict[str, Any]:
+    import httpx  # transport of google-genai
+
+    args: dict[str, Any] = {
+        "limits": httpx.Limits(
+            max_keepalive_connections=_KEEPALIVE_CONNECTIONS,
+            max_connections=_MAX_CONNECTIONS,
+            keepalive_expiry=_KEEPALIVE_EXPIRY_S,
+        )
+    }
+    # HTTP/2 multiplexes concurrent requests over one TLS connection; httpx needs `h2` for it
+    if importlib.util.find_spec("h2") is not None:
+        args["http2"] = True
+    return args
+
+
+def _new_client(api_key: str) -> genai.Client:
+    try:
+        http_options = types.HttpOptions(client_args=_httpx_client_args())
+    except Exception:  # older google-genai without client_args: keep its default transport
+        return genai.Client(api_key=api_key)
+    return genai.Client(api_key=api_key, http_options=http_options)
+
+
+def get_genai_client(api_key: str) -> genai.Client:
+    """
+    Return the process-wide Gemini client for this API key, creating it on first use.
+    """
+    client = _CLIENT_CACHE.get(api_key)
+    if client is None:
+        with _CLIENT_LOCK:
+            client = _CLIENT_CACHE.get(api_key)
+            if client is None:
+                client = _CLIENT_CACHE[api_key] = _new_client(api_key)
+    return client
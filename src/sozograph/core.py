@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 from .schema import Passport
@@ -9,10 +10,12 @@ from .ingest import (
     load_ingest_config,
     coerce_to_interactions,
     apply_fallback_summaries,
+    submit_fallback_summaries,
 )
 from .extractor import Extractor
 from .resolver import merge_passport_update, ResolveStats
 from .render import export_context as _export_context
+from .utils import fast_id
 
 
 def _require_api_key(passed: Optional[str]) -> str:
@@ -52,6 +55,7 @@ class SozoGraph:
         fallback_model: str = "gemini-3-flash-preview",
         enable_fallback_summarizer: Optional[bool] = None,
         max_interaction_chars: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
     ):
         self.api_key = _require_api_key(api_key)
         self.extractor_model = extractor_model or _default_extractor_model()
@@ -62,9 +66,15 @@ class SozoGraph:
             cfg.enable_fallback_summarizer = bool(enable_fallback_summarizer)
         if max_interaction_chars is not None:
             cfg.max_interaction_chars = int(max_interaction_chars)
+        if max_concurrency is not None:
+            cfg.max_concurrency = int(max_concurrency)
         self.ingest_cfg = cfg
 
-        self.extractor = Extractor(api_key=self.api_key, model=self.extractor_model)
+        self.extractor = Extractor(
+            api_key=self.api_key,
+            model=self.extractor_model,
+            max_chars=cfg.max_interaction_chars,
+        )
 
     def ingest(
         self,
@@ -73,6 +83,7 @@ class SozoGraph:
         passport: Optional[Passport] = None,
         meta: Optional[Dict[str, Any]] = None,
         hint: Optional[str] = None,
+        async_fallback: bool = False,
     ) -> Tuple[Passport, List[ResolveStats]]:
         """
         Ingest any supported input and return updated Passport + per-interaction stats.
@@ -81,6 +92,10 @@ class SozoGraph:
         - str (transcript)
         - dict (firestore doc / rtdb snapshot envelope / supabase row envelope)
         - list (mixed)
+
+        async_fallback=True overlaps fallback summarization with extraction: interactions
+        with usable text are extracted right away, weak ones as soon as their summary lands.
+        The resulting passport is the same as with the default (summarize everything first).
         """
         base = passport or Passport()
         meta = meta or {}
@@ -88,33 +103,56 @@ class SozoGraph:
         interactions, sources = coerce_to_interactions(data, hint=hint, meta=meta)
 
         # Attach sources to passport (unique by id)
-        for s in sources:
-            base.upsert_source(s)
+        base.upsert_sources(sources)
 
         # Improve weak texts via Gemini fallback summarizer (optional)
-        interactions = apply_fallback_summaries(
-            interactions,
-            sources=sources,
-            api_key=self.api_key,
-            cfg=self.ingest_cfg,
-            fallback_model=self.fallback_model,
-        )
+        fallback_pool: Optional[ThreadPoolExecutor] = None
+        pending: Dict[int, Future] = {}
+        if async_fallback:
+            fallback_pool = ThreadPoolExecutor(max_workers=max(1, self.ingest_cfg.max_concurrency))
+            pending = submit_fallback_summaries(
+                interactions,
+                api_key=self.api_key,
+                cfg=self.ingest_cfg,
+                executor=fallback_pool,
+                fallback_model=self.fallback_model,
+            )
+        else:
+            interactions = apply_fallback_summaries(
+                interactions,
+                sources=sources,
+                api_key=self.api_key,
+                cfg=self.ingest_cfg,
+                fallback_model=self.fallback_model,
+            )
+
+        # Pick the closest source id for each interaction.
+        # In v1 we keep it deterministic: use meta.source_id if provided, else derive one
+        # from the source pointer (computed once per unique pointer), else stable index-based.
+        fixed_source_id = meta.get("source_id")
+        pointer_ids: Dict[str, str] = {}
+        if not fixed_source_id:
+            # fast_id is content-derived, so ids survive process restarts (hash() is salted per process)
+            pointer_ids = {s.source: f"src_{fast_id(s.source)}" for s in sources if s.source}
+        source_ids: List[str] = [
+            fixed_source_id or pointer_ids.get(it.source or "") or f"i_{idx}"
+            for idx, it in enumerate(interactions)
+        ]
+
+        # Extract concurrently (network-bound), then merge sequentially in input order (temporal truth)
+        try:
+            updates = self.extractor.extract_batch(
+                interactions,
+                source_ids,
+                max_concurrency=self.ingest_cfg.max_concurrency,
+                wait_for=pending,
+            )
+        finally:
+            if fallback_pool is not None:
+                fallback_pool.shutdown(wait=True, cancel_futures=True)
 
-        # Extract + merge sequentially (temporal truth)
         stats_list: List[ResolveStats] = []
-        for idx, it in enumerate(interactions):
-            # Pick the closest source id for this interaction.
-            # In v1 we keep it deterministic: use meta.source_id if provided, else stable index-based.
-            source_id = meta.get("source_id")
-            if not source_id:
-                # Try find a matching SourceRef by pointer; otherwise create a stable one
-                if it.source:
-                    # If user provided source pointer, use it to derive stable id
-                    source_id = f"src_{abs(hash(it.source)) % 10_000_000}"
-                else:
-                    source_id = f"i_{idx}"
-
-            update = self.extractor.extract(it, source_id=source_id)
+        for update in updates:
             base, stats = merge_passport_update(
                 base,
                 facts=update["facts"],
@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-import json
-from typing import Dict, List
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Type, TypeVar, Union
 
-from google import genai
 from google.genai import types
 from pydantic import ValidationError
 
+from .clients import get_genai_client
 from .interaction import Interaction
 from .schema import Fact, Preference, Entity, OpenLoop
 from .prompts import (
@@ -14,7 +14,9 @@ from .prompts import (
     EXTRACTOR_JSON_SCHEMA,
     EXTRACTOR_USER_PROMPT_TEMPLATE,
 )
-from .utils import normalize_key, parse_ts
+from .utils import PromptTemplate, json_loads, normalize_key, parse_ts
+
+KV = TypeVar("KV", bound=Union[Fact, Preference])
 
 
 class Extractor:
@@ -22,99 +24,162 @@ class Extractor:
     Gemini-backed extractor that converts Interactions into candidate memory updates.
     """
 
-    def __init__(self, api_key: str, model: str):
-        self.client = genai.Client(api_key=api_key)
+    def __init__(self, api_key: str, model: str, max_chars: int = 4000):
+        self.client = get_genai_client(api_key)
         self.model = model
+        self.max_chars = int(max_chars)
+
+        # Static parts of every request are rendered once. Keeping them identical
+        # (and first) across calls also lets Gemini's implicit prefix caching kick in.
+        self._prompt = PromptTemplate(
+            EXTRACTOR_USER_PROMPT_TEMPLATE,
+            schema=EXTRACTOR_JSON_SCHEMA.strip(),
+        )
+        self._config = types.GenerateContentConfig(
+            system_instruction=EXTRACTOR_SYSTEM_PROMPT,
+            temperature=0.2,
+            response_mime_type="application/json",
+        )
 
     def extract(self, interaction: Interaction, source_id: str) -> Dict[str, List]:
         """
         Extract candidate facts/prefs/entities/open_loops from a single Interaction.
         Returns dict with keys: facts, prefs, entities, open_loops.
         """
-        prompt = EXTRACTOR_USER_PROMPT_TEMPLATE.format(
-            schema=EXTRACTOR_JSON_SCHEMA.strip(),
+        prompt = self._prompt.render(
             source_id=source_id,
             interaction_type=interaction.type,
             ts_iso=interaction.ts.isoformat(),
-            interaction_text=interaction.short_text(),
+            interaction_text=interaction.short_text(self.max_chars),
         )
 
         response = self.client.models.generate_content(
             model=self.model,
-            contents=[
-                types.Content(role="system", parts=[types.Part(text=EXTRACTOR_SYSTEM_PROMPT)]),
-                types.Content(role="user", parts=[types.Part(text=prompt)]),
-            ],
-            config=types.GenerateContentConfig(
-                temperature=0.2,
-                response_mime_type="application/json",
-            ),
+            contents=[types.Content(role="user", parts=[types.Part(text=prompt)])],
+            config=self._config,
         )
 
         try:
-            payload = json.loads(response.text)
+            payload = json_loads(response.text)
         except Exception as e:
             raise RuntimeError(f"Extractor returned invalid JSON: {e}\n{response.text}")
+        if not isinstance(payload, dict):
+            raise RuntimeError(f"Extractor returned a non-object JSON payload:\n{response.text}")
 
         return self._validate_and_normalize(payload, source_id)
 
+    def extract_batch(
+        self,
+        interactions: Sequence[Interaction],
+        source_ids: Sequence[str],
+        *,
+        max_concurrency: int = 8,
+        wait_for: Optional[Mapping[int, Future]] = None,
+    ) -> List[Dict[str, List]]:
+        """
+        Extract many Interactions concurrently.
+
+        Requests are network-bound, so they are issued from a bounded thread pool.
+        Results are returned in input order; the caller stays responsible for
+        merging them sequentially (temporal truth).
+
+        wait_for maps an interaction index to a future that must finish before that
+        interaction is extracted (e.g. a pending fallback summary of its text).
+        """
+        if len(interactions) != len(source_ids):
+            raise ValueError("interactions and source_ids must have the same length")
+        if not interactions:
+            return []
+
+        pending = wait_for or {}
+
+        def run(idx: int) -> Dict[str, List]:
+            ready = pending.get(idx)
+            if ready is not None:
+                ready.result()
+            return self.extract(interactions[idx], source_id=source_ids[idx])
+
+        workers = max(1, min(int(max_concurrency), len(interactions)))
+        if workers == 1:
+            return [run(idx) for idx in range(len(interactions))]
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            # Ready interactions first, so waiting ones never hold a worker another could use
+            order = sorted(range(len(interactions)), key=lambda idx: idx in pending)
+            futures = {idx: pool.submit(run, idx) for idx in order}
+            return [futures[idx].result() for idx in range(len(interactions))]
+
     def _validate_and_normalize(self, data: Dict, source_id: str) -> Dict[str, List]:
         """
         Validate model output and normalize keys/timestamps.
+
+        Malformed items are skipped; one bad item never drops the whole update.
         """
-        out = {
-            "facts": [],
-            "prefs": [],
-            "entities": [],
-            "open_loops": [],
+        return {
+            "facts": _build_kv_items(Fact, data.get("facts"), source_id),
+            "prefs": _build_kv_items(Preference, data.get("prefs"), source_id),
+            "entities": _build_entities(data.get("entities")),
+            "open_loops": _build_open_loops(data.get("open_loops"), source_id),
         }
 
-        for item in data.get("facts", []):
-            try:
-                f = Fact(
-                    key=normalize_key(item["key"]),
-                    value=item.get("value"),
-                    confidence=float(item.get("confidence", 0.7)),
-                    source=source_id,
-                    ts=parse_ts(item.get("ts")) or None,
-                )
-                out["facts"].append(f)
-            except ValidationError:
-                continue
 
-        for item in data.get("prefs", []):
-            try:
-                p = Preference(
+_SKIP_ERRORS = (ValidationError, KeyError, TypeError, ValueError)
+
+
+def _ts_kwargs(raw: Any) -> Dict[str, Any]:
+    # Only pass ts when it parses; otherwise let the model default (utcnow) apply.
+    ts = parse_ts(raw)
+    return {"ts": ts} if ts is not None else {}
+
+
+def _build_kv_items(cls: Type[KV], items: Any, source_id: str) -> List[KV]:
+    out: List[KV] = []
+    append = out.append
+    for item in items or ():
+        if not isinstance(item, dict):
+            continue
+        try:
+            append(
+                cls(
                     key=normalize_key(item["key"]),
                     value=item.get("value"),
                     confidence=float(item.get("confidence", 0.7)),
                     source=source_id,
-                    ts=parse_ts(item.get("ts")) or None,
+                    **_ts_kwargs(item.get("ts")),
                 )
-                out["prefs"].append(p)
-            except ValidationError:
-                continue
-
-        for item in data.get("entities", []):
-            try:
-                e = Entity(
+            )
+        except _SKIP_ERRORS:
+            continue
+    return out
+
+
+def _build_entities(items: Any) -> List[Entity]:
+    out: List[Entity] = []
+    append = out.append
+    for item in items or ():
+        if not isinstance(item, dict):
+            continue
+        try:
+            append(
+                Entity(
                     name=item["name"],
                     type=item.get("type", "other"),
                     aliases=item.get("aliases") or [],
                 )
-                out["entities"].append(e)
-            except ValidationError:
-                continue
-
-        for item in data.get("open_loops", []):
-            try:
-                o = OpenLoop(
-                    item=item["item"],
-                    source=source_id,
-                    ts=parse_ts(item.get("ts")) or None,
-                )
-                out["open_loops"].append(o)
-            except ValidationError:
-                continue
-
-        return out
+            )
+        except _SKIP_ERRORS:
+            continue
+    return out
+
+
+def _build_open_loops(items: Any, source_id: str) -> List[OpenLoop]:
+    out: List[OpenLoop] = []
+    append = out.append
+    for item in items or ():
+        if not isinstance(item, dict):
+            continue
+        try:
+            append(OpenLoop(item=item["item"], source=source_id, **_ts_kwargs(item.get("ts"))))
+        except _SKIP_ERRORS:
+            continue
+    return out
@@ -1,22 +1,25 @@
 from __future__ import annotations
 
-import json
 import os
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple, Union
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
-from google import genai
 from google.genai import types
 
+from .clients import get_genai_client
 from .interaction import Interaction
 from .schema import Passport, SourceRef
-from .utils import utcnow, sha256_json, parse_ts, safe_stringify
+from .utils import PromptTemplate, utcnow, sha256_json, fast_id, json_dumps_compact, json_loads, parse_ts, safe_stringify
 from .adapters.firestore import firestore_to_interaction, firestore_batch_to_interactions
 from .adapters.rtdb import rtdb_to_interaction, rtdb_batch_to_interactions
 from .adapters.supabase import supabase_row_to_interaction, supabase_batch_to_interactions
 from .prompts import (
     FALLBACK_SUMMARIZER_SYSTEM_PROMPT,
     FALLBACK_SUMMARIZER_USER_PROMPT_TEMPLATE,
+    FALLBACK_SUMMARIZER_BATCH_SYSTEM_PROMPT,
+    FALLBACK_SUMMARIZER_BATCH_USER_PROMPT_TEMPLATE,
 )
 
 
@@ -24,6 +27,8 @@ from .prompts import (
 class IngestConfig:
     enable_fallback_summarizer: bool = True
     max_interaction_chars: int = 4000
+    max_concurrency: int = 8
+    fallback_batch_size: int = 16
 
 
 def _env_bool(name: str, default: bool) -> bool:
@@ -33,13 +38,32 @@ def _env_bool(name: str, default: bool) -> bool:
     return v.strip().lower() in ("1", "true", "yes", "y", "on")
 
 
-def load_ingest_config() -> IngestConfig:
+@lru_cache(maxsize=1)
+def _ingest_config_from_env() -> IngestConfig:
     return IngestConfig(
         enable_fallback_summarizer=_env_bool("SOZOGRAPH_ENABLE_FALLBACK_SUMMARIZER", True),
         max_interaction_chars=int(os.getenv("SOZOGRAPH_MAX_INTERACTION_CHARS", "4000")),
+        max_concurrency=int(os.getenv("SOZOGRAPH_MAX_CONCURRENCY", "8")),
+        fallback_batch_size=int(os.getenv("SOZOGRAPH_FALLBACK_BATCH_SIZE", "16")),
     )
 
 
+def load_ingest_config() -> IngestConfig:
+    """
+    IngestConfig from SOZOGRAPH_* env vars. The environment is read once per process;
+    each call returns a fresh copy, so callers may mutate it freely.
+    """
+    return replace(_ingest_config_from_env())
+
+
+def reload_ingest_config() -> IngestConfig:
+    """
+    Re-read SOZOGRAPH_* env vars (e.g. after changing them in tests).
+    """
+    _ingest_config_from_env.cache_clear()
+    return load_ingest_config()
+
+
 def _looks_like_rtdb_envelope(obj: Dict[str, Any]) -> bool:
     return "path" in obj and ("value" in obj or "data" in obj)
 
@@ -48,6 +72,17 @@ def _looks_like_supabase_envelope(obj: Dict[str, Any]) -> bool:
     return "table" in obj and ("row" in obj or "data" in obj)
 
 
+def _looks_like_firestore_batch(obj: Dict[str, Any]) -> bool:
+    # {doc_id: doc}: every value is a dict and at least one key is non-empty (single pass)
+    has_key = False
+    for k, v in obj.items():
+        if not isinstance(v, dict):
+            return False
+        if k:
+            has_key = True
+    return has_key
+
+
 def _guess_hint(obj: Dict[str, Any]) -> str:
     """
     Best-effort hint detection when user doesn't specify.
@@ -60,22 +95,66 @@ def _guess_hint(obj: Dict[str, Any]) -> str:
     return "firestore"
 
 
+class _AlnumOnlyMap(dict):
+    """
+    str.translate table that deletes every non-alphanumeric code point (per str.isalnum).
+    ASCII is prebuilt; other code points are filled in on first sight.
+    """
+
+    def __missing__(self, codepoint: int) -> Optional[int]:
+        v = codepoint if chr(codepoint).isalnum() else None
+        self[codepoint] = v
+        return v
+
+
+_ALNUM_ONLY = _AlnumOnlyMap((c, c if chr(c).isalnum() else None) for c in range(128))
+
+
 def _is_text_too_weak(text: str) -> bool:
     """
     Decide whether deterministic text is too weak and needs Gemini fallback.
     We keep this simple and conservative in v1.
     """
-    if not text:
+    # Stripping can only shorten the text, so short inputs are rejected before copying
+    if not text or len(text) < 30:
         return True
     t = text.strip()
-    if len(t) < 30:
+    n = len(t)
+    if n < 30:
         return True
     # If it looks like "key: val; key: val" only, we may still accept it;
     # but if it's mostly punctuation/noise, fallback.
-    alnum = sum(ch.isalnum() for ch in t)
-    if alnum / max(len(t), 1) < 0.35:
-        return True
-    return False
+    return len(t.translate(_ALNUM_ONLY)) / n < 0.35
+
+
+@dataclass
+class SummaryRequest:
+    """One object to summarize in FallbackSummarizer.summarize_batch()."""
+
+    obj: Any
+    source_hint: str
+    source_pointer: Optional[str]
+    ts_iso: str
+
+
+_EMPTY_SUMMARY = "Database object (unstructured)."
+
+# Parsed once; render() only concatenates (object JSON can be large)
+_FALLBACK_PROMPT = PromptTemplate(FALLBACK_SUMMARIZER_USER_PROMPT_TEMPLATE)
+_FALLBACK_BATCH_PROMPT = PromptTemplate(FALLBACK_SUMMARIZER_BATCH_USER_PROMPT_TEMPLATE)
+
+# Leaf strings longer than this are clipped before an object is serialized into a prompt
+_MAX_FIELD_CHARS = 1000
+
+
+def _clip_strings(obj: Any, max_len: int) -> Any:
+    if isinstance(obj, str):
+        return obj if len(obj) <= max_len else obj[: max_len - 1] + "…"
+    if isinstance(obj, dict):
+        return {k: _clip_strings(v, max_len) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_clip_strings(v, max_len) for v in obj]
+    return obj
 
 
 class FallbackSummarizer:
@@ -84,9 +163,63 @@ class FallbackSummarizer:
     deterministically from an object.
     """
 
-    def __init__(self, api_key: str, model: str = "gemini-3-flash-preview"):
-        self.client = genai.Client(api_key=api_key)
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gemini-3-flash-preview",
+        max_object_chars: int = 16000,
+        max_summary_chars: int = 4000,
+    ):
+        self.client = get_genai_client(api_key)
         self.model = model
+        self.max_object_chars = int(max_object_chars)
+
+        # Structured output keeps replies to the summary itself (no "Summary:" preambles)
+        # and lets the model stop at the length the caller would truncate to anyway.
+        summary_schema = types.Schema(type=types.Type.STRING, max_length=int(max_summary_chars))
+        self._config = types.GenerateContentConfig(
+            system_instruction=FALLBACK_SUMMARIZER_SYSTEM_PROMPT,
+            temperature=0.2,
+            response_mime_type="application/json",
+            response_schema=types.Schema(
+                type=types.Type.OBJECT,
+                properties={"summary": summary_schema},
+                required=["summary"],
+            ),
+        )
+        self._batch_config = types.GenerateContentConfig(
+            system_instruction=FALLBACK_SUMMARIZER_BATCH_SYSTEM_PROMPT,
+            temperature=0.2,
+            response_mime_type="application/json",
+            response_schema=types.Schema(
+                type=types.Type.OBJECT,
+                properties={
+                    "summaries": types.Schema(
+                        type=types.Type.ARRAY,
+                        items=types.Schema(
+                            type=types.Type.OBJECT,
+                            properties={
+                                "i": types.Schema(type=types.Type.INTEGER),
+                                "text": summary_schema,
+                            },
+                            required=["i", "text"],
+                        ),
+                    )
+                },
+                required=["summaries"],
+            ),
+        )
+
+    def _object_json(self, obj: Any) -> str:
+        # Compact JSON: indentation roughly doubles prompt tokens for nothing.
+        # Long leaf strings are clipped before serializing, the result is capped after.
+        try:
+            object_json = json_dumps_compact(_clip_strings(obj, _MAX_FIELD_CHARS))
+        except Exception:
+            object_json = safe_stringify(obj)
+        if len(object_json) > self.max_object_chars:
+            object_json = object_json[: self.max_object_chars - 1] + "…"
+        return object_json
 
     def summarize(
         self,
@@ -96,13 +229,9 @@ class FallbackSummarizer:
         source_pointer: Optional[str],
         ts_iso: str,
     ) -> str:
-        object_json = ""
-        try:
-            object_json = json.dumps(obj, indent=2, ensure_ascii=False, default=str)
-        except Exception:
-            object_json = safe_stringify(obj)
+        object_json = self._object_json(obj)
 
-        prompt = FALLBACK_SUMMARIZER_USER_PROMPT_TEMPLATE.format(
+        prompt = _FALLBACK_PROMPT.render(
             source_hint=source_hint,
             source_pointer=source_pointer or "",
             ts_iso=ts_iso,
@@ -111,18 +240,92 @@ class FallbackSummarizer:
 
         resp = self.client.models.generate_content(
             model=self.model,
-            contents=[
-                types.Content(role="system", parts=[types.Part(text=FALLBACK_SUMMARIZER_SYSTEM_PROMPT)]),
-                types.Content(role="user", parts=[types.Part(text=prompt)]),
-            ],
-            config=types.GenerateContentConfig(
-                temperature=0.2,
-            ),
+            contents=[types.Content(role="user", parts=[types.Part(text=prompt)])],
+            config=self._config,
         )
 
-        txt = (resp.text or "").strip()
+        raw = resp.text or ""
+        try:
+            txt = str(json_loads(raw)["summary"]).strip()
+        except Exception:
+            # Tolerate a plain-text reply rather than losing the summary
+            txt = raw.strip()
         # Final guard: never return empty
-        return txt if txt else "Database object (unstructured)."
+        return txt if txt else _EMPTY_SUMMARY
+
+    def summarize_batch(self, requests: Sequence[SummaryRequest]) -> List[str]:
+        """
+        Summarize many objects with a single Gemini call.
+
+        Returns one summary per request, in order. Any summary the model omits
+        (or a response that is not valid JSON) falls back to summarize() per item.
+        """
+        if not requests:
+            return []
+        if len(requests) == 1:
+            r = requests[0]
+            return [
+                self.summarize(
+                    r.obj,
+                    source_hint=r.source_hint,
+                    source_pointer=r.source_pointer,
+                    ts_iso=r.ts_iso,
+                )
+            ]
+
+        # Each object goes through _object_json so the per-object cap applies here too
+        # (clipping leaf strings alone does not bound long lists or wide dicts). Its text
+        # is spliced in as the "object" value; untruncated, that is the same compact JSON.
+        items: List[str] = []
+        for i, r in enumerate(requests):
+            head = json_dumps_compact(
+                {
+                    "i": i,
+                    "source_hint": r.source_hint,
+                    "source_pointer": r.source_pointer or "",
+                    "ts_iso": r.ts_iso,
+                }
+            )
+            items.append(f'{head[:-1]},"object":{self._object_json(r.obj)}}}')
+        objects_json = "[" + ",".join(items) + "]"
+
+        prompt = _FALLBACK_BATCH_PROMPT.render(objects_json=objects_json)
+
+        resp = self.client.models.generate_content(
+            model=self.model,
+            contents=[types.Content(role="user", parts=[types.Part(text=prompt)])],
+            config=self._batch_config,
+        )
+
+        by_index: Dict[int, str] = {}
+        try:
+            payload = json_loads(resp.text or "")
+            entries = payload.get("summaries") or []
+            if not isinstance(entries, list):
+                entries = []
+        except Exception:
+            entries = []
+        for entry in entries:
+            # A malformed entry only costs its own item a summarize() retry
+            try:
+                txt = str(entry.get("text") or "").strip()
+                if txt:
+                    by_index[int(entry["i"])] = txt
+            except Exception:
+                continue
+
+        out: List[str] = []
+        for i, r in enumerate(requests):
+            txt = by_index.get(i)
+            if txt is None:
+                txt = self.summarize(
+                    r.obj,
+                    source_hint=r.source_hint,
+                    source_pointer=r.source_pointer,
+                    ts_iso=r.ts_iso,
+                )
+            out.append(txt)
+        return out
 
 
 def make_source_ref(
@@ -132,13 +335,18 @@ def make_source_ref(
     payload: Any,
     ts: Optional[Any] = None,
     source_pointer: Optional[str] = None,
+    hash: Optional[str] = None,
 ) -> SourceRef:
+    """
+    Build a SourceRef. Pass hash= when sha256_json(payload) is already known
+    to skip serializing the payload a second time.
+    """
     dt = parse_ts(ts) or utcnow()
     return SourceRef(
         id=source_id,
         kind=kind,  # validated later by pydantic in Passport
         ts=dt,
-        hash=sha256_json(payload),
+        hash=hash or sha256_json(payload),
         source=source_pointer,
     )
 
@@ -156,12 +364,43 @@ def coerce_to_interactions(
     Gemini fallback summarization is applied later by apply_fallback_summaries().
     """
     meta = meta or {}
+    if not isinstance(item, list):
+        return _coerce_single(item, hint=hint, meta=meta)
+
+    # List of mixed items: handled in one loop instead of one recursive call per element
+    interactions: List[Interaction] = []
+    sources: List[SourceRef] = []
+    # allow per-item override without forcing shape; a parent source_id is kept as-is,
+    # so meta can then be shared (Interaction validation copies it anyway)
+    keep_meta = "source_id" in meta
+    for idx, sub in enumerate(item):
+        sub_meta = meta if keep_meta else {**meta, "source_id": f"h_{idx}"}
+        if isinstance(sub, list):
+            sub_interactions, sub_sources = coerce_to_interactions(sub, hint=hint, meta=sub_meta)
+        else:
+            sub_interactions, sub_sources = _coerce_single(sub, hint=hint, meta=sub_meta)
+        interactions.extend(sub_interactions)
+        sources.extend(sub_sources)
+    return interactions, sources
+
+
+def _coerce_single(
+    item: Any,
+    *,
+    hint: Optional[str],
+    meta: Dict[str, Any],
+) -> Tuple[List[Interaction], List[SourceRef]]:
+    """
+    coerce_to_interactions() for one non-list item.
+    """
     interactions: List[Interaction] = []
     sources: List[SourceRef] = []
 
     # 1) String transcript
     if isinstance(item, str):
-        src_id = meta.get("source_id") or f"t{abs(hash(item)) % 10_000_000}"
+        payload = {"text": item, "meta": meta}
+        payload_hash = sha256_json(payload)
+        src_id = meta.get("source_id") or f"t{payload_hash[:12]}"
         src_ptr = meta.get("source") or meta.get("source_pointer")
         ts = parse_ts(meta.get("ts")) or utcnow()
 
@@ -180,25 +419,15 @@ def coerce_to_interactions(
             make_source_ref(
                 source_id=src_id,
                 kind=meta.get("kind", "transcript"),
-                payload={"text": item, "meta": meta},
+                payload=payload,
                 ts=ts,
                 source_pointer=src_ptr,
+                hash=payload_hash,
             )
         )
         return interactions, sources
 
-    # 2) List of mixed items
-    if isinstance(item, list):
-        for idx, sub in enumerate(item):
-            sub_meta = dict(meta)
-            # allow per-item override without forcing shape
-            sub_meta.setdefault("source_id", f"{meta.get('source_id','h')}_{idx}")
-            sub_interactions, sub_sources = coerce_to_interactions(sub, hint=hint, meta=sub_meta)
-            interactions.extend(sub_interactions)
-            sources.extend(sub_sources)
-        return interactions, sources
-
-    # 3) Dict objects (DB docs / envelopes)
+    # 2) Dict objects (DB docs / envelopes)
     if isinstance(item, dict):
         used_hint = (hint or item.get("_hint") or _guess_hint(item)).lower().strip()
 
@@ -208,7 +437,8 @@ def coerce_to_interactions(
             value = item.get("value", item.get("data"))
             it = rtdb_to_interaction(value, path=path)
 
-            src_id = meta.get("source_id") or f"r{abs(hash(sha256_json(item))) % 10_000_000}"
+            payload_hash = sha256_json(item)
+            src_id = meta.get("source_id") or f"r{payload_hash[:12]}"
             sources.append(
                 make_source_ref(
                     source_id=src_id,
@@ -216,6 +446,7 @@ def coerce_to_interactions(
                     payload=item,
                     ts=it.ts,
                     source_pointer=it.source,
+                    hash=payload_hash,
                 )
             )
             interactions.append(it)
@@ -227,7 +458,8 @@ def coerce_to_interactions(
             row = item.get("row", item.get("data", item))
             it = supabase_row_to_interaction(row if isinstance(row, dict) else {"value": row}, table=table)
 
-            src_id = meta.get("source_id") or f"s{abs(hash(sha256_json(item))) % 10_000_000}"
+            payload_hash = sha256_json(item)
+            src_id = meta.get("source_id") or f"s{payload_hash[:12]}"
             sources.append(
                 make_source_ref(
                     source_id=src_id,
@@ -235,6 +467,7 @@ def coerce_to_interactions(
                     payload=item,
                     ts=it.ts,
                     source_pointer=it.source,
+                    hash=payload_hash,
                 )
             )
             interactions.append(it)
@@ -243,31 +476,33 @@ def coerce_to_interactions(
         # Firestore: doc dict OR batch dict/list
         if used_hint == "firestore":
             # batch dict mapping {doc_id: doc}
-            if all(isinstance(v, dict) for v in item.values()) and any(k for k in item.keys()):
+            if _looks_like_firestore_batch(item):
                 # ambiguous: could be a single doc with many nested dicts; we treat as batch
                 col_path = meta.get("source") or meta.get("collection_path")
                 its = firestore_batch_to_interactions(item, collection_path=col_path)
                 # One source per interaction for traceability
+                fixed_src_id = meta.get("source_id")
                 for it in its:
-                    src_id = meta.get("source_id") or f"f{abs(hash(sha256_json(it.data))) % 10_000_000}"
+                    payload_hash = sha256_json(it.data)
                     sources.append(
                         make_source_ref(
-                            source_id=src_id,
+                            source_id=fixed_src_id or f"f{payload_hash[:12]}",
                             kind="firestore",
                             payload=it.data,
                             ts=it.ts,
                             source_pointer=it.source,
+                            hash=payload_hash,
                         )
                     )
-                    interactions.append(it)
-                return interactions, sources
+                return its, sources
 
             # single doc
             doc_id = item.get("id") or meta.get("id")
             src_ptr = meta.get("source") or meta.get("source_pointer") or None
             it = firestore_to_interaction(item, source=src_ptr, doc_id=doc_id)
 
-            src_id = meta.get("source_id") or f"f{abs(hash(sha256_json(item))) % 10_000_000}"
+            payload_hash = sha256_json(item)
+            src_id = meta.get("source_id") or f"f{payload_hash[:12]}"
             sources.append(
                 make_source_ref(
                     source_id=src_id,
@@ -275,6 +510,7 @@ def coerce_to_interactions(
                     payload=item,
                     ts=it.ts,
                     source_pointer=it.source,
+                    hash=payload_hash,
                 )
             )
             interactions.append(it)
@@ -283,12 +519,13 @@ def coerce_to_interactions(
         # Unknown dict: treat as generic event
         text = safe_stringify(item)
         ts = parse_ts(item.get("ts") if isinstance(item, dict) else None) or utcnow()
-        src_id = meta.get("source_id") or f"u{abs(hash(sha256_json(item))) % 10_000_000}"
+        payload_hash = sha256_json(item)
+        src_id = meta.get("source_id") or f"u{payload_hash[:12]}"
         src_ptr = meta.get("source") or meta.get("source_pointer")
 
         interactions.append(
             Interaction(
-                id=meta.get("id") or item.get("id") or sha256_json(item)[:16],
+                id=meta.get("id") or item.get("id") or fast_id(item),
                 ts=ts,
                 type=meta.get("type", "unknown"),
                 text=text,
@@ -304,18 +541,21 @@ def coerce_to_interactions(
                 payload=item,
                 ts=ts,
                 source_pointer=src_ptr,
+                hash=payload_hash,
             )
         )
         return interactions, sources
 
-    # 4) Fallback for other types
+    # 3) Fallback for other types
     text = safe_stringify(item)
     ts = parse_ts(meta.get("ts")) or utcnow()
-    src_id = meta.get("source_id") or f"x{abs(hash(str(item))) % 10_000_000}"
+    payload = {"value": str(item), "meta": meta}
+    payload_hash = sha256_json(payload)
+    src_id = meta.get("source_id") or f"x{payload_hash[:12]}"
     src_ptr = meta.get("source") or meta.get("source_pointer")
     interactions.append(
         Interaction(
-            id=meta.get("id") or sha256_json({"v": str(item)})[:16],
+            id=meta.get("id") or fast_id({"v": str(item)}),
             ts=ts,
             type=meta.get("type", "unknown"),
             text=text,
@@ -328,14 +568,52 @@ def coerce_to_interactions(
         make_source_ref(
             source_id=src_id,
             kind=meta.get("kind", "unknown"),
-            payload={"value": str(item), "meta": meta},
+            payload=payload,
             ts=ts,
             source_pointer=src_ptr,
+            hash=payload_hash,
         )
     )
     return interactions, sources
 
 
+def _weak_batches(interactions: List[Interaction], cfg: IngestConfig) -> List[List[int]]:
+    """
+    Truncate oversized texts in place and group the indexes of weak interactions
+    into summarizer batches.
+    """
+    weak: List[int] = []
+    max_chars = cfg.max_interaction_chars
+    for idx, it in enumerate(interactions):
+        txt = it.text
+        # truncate before evaluating (avoid massive stringify); one check on the local text
+        if txt and len(txt) > max_chars:
+            txt = it.text = txt[: max_chars - 1] + "…"
+        if _is_text_too_weak(txt):
+            weak.append(idx)
+
+    batch_size = max(1, int(cfg.fallback_batch_size))
+    return [weak[start : start + batch_size] for start in range(0, len(weak), batch_size)]
+
+
+def _summarize_into(summarizer: FallbackSummarizer, batch: List[Interaction], max_chars: int) -> None:
+    # Summarize weak interactions a batch at a time (one Gemini call per batch)
+    improved_texts = summarizer.summarize_batch(
+        [
+            SummaryRequest(
+                # Summarize the raw object if present, else summarize the weak text
+                obj=it.data if it.data is not None else {"text": it.text},
+                source_hint=it.type,
+                source_pointer=it.source,
+                ts_iso=it.ts.isoformat(),
+            )
+            for it in batch
+        ]
+    )
+    for it, improved in zip(batch, improved_texts, strict=True):
+        it.text = improved[:max_chars] if improved else it.text
+
+
 def apply_fallback_summaries(
     interactions: List[Interaction],
     *,
@@ -355,41 +633,67 @@ def apply_fallback_summaries(
     if not api_key:
         return interactions
 
-    summarizer = FallbackSummarizer(api_key=api_key, model=fallback_model)
-
-    # Map source id by interaction id/source pointer best-effort
-    # (In v1 we keep this simple: use first matching source if possible)
-    src_by_pointer: Dict[str, SourceRef] = {}
-    for s in sources:
-        if s.source:
-            src_by_pointer[s.source] = s
-
-    out: List[Interaction] = []
-    for it in interactions:
-        txt = it.text or ""
-        # truncate before evaluating (avoid massive stringify)
-        if len(txt) > cfg.max_interaction_chars:
-            txt = txt[: cfg.max_interaction_chars - 1] + "…"
-            it.text = txt
-
-        if not _is_text_too_weak(it.text):
-            out.append(it)
-            continue
-
-        # Summarize the raw object if present, else summarize the weak text
-        payload = it.data if it.data is not None else {"text": it.text}
-
-        improved = summarizer.summarize(
-            payload,
-            source_hint=it.type,
-            source_pointer=it.source,
-            ts_iso=it.ts.isoformat(),
-        )
+    summarizer = FallbackSummarizer(
+        api_key=api_key,
+        model=fallback_model,
+        max_object_chars=cfg.max_interaction_chars * 4,
+        max_summary_chars=cfg.max_interaction_chars,
+    )
 
-        it.text = improved[: cfg.max_interaction_chars] if improved else it.text
-        out.append(it)
+    # Interactions are improved in place; no need to copy them into a new list.
+    batches = [[interactions[i] for i in b] for b in _weak_batches(interactions, cfg)]
 
-    return out
+    # Batch calls are network-bound: issue them from a bounded thread pool
+    workers = max(1, min(int(cfg.max_concurrency), len(batches)))
+    if workers == 1:
+        for batch in batches:
+            _summarize_into(summarizer, batch, cfg.max_interaction_chars)
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(lambda b: _summarize_into(summarizer, b, cfg.max_interaction_chars), batches))
+
+    return interactions
+
+
+def submit_fallback_summaries(
+    interactions: List[Interaction],
+    *,
+    api_key: Optional[str],
+    cfg: IngestConfig,
+    executor: Executor,
+    fallback_model: str = "gemini-3-flash",
+) -> Dict[int, Future[None]]:
+    """
+    Non-blocking variant of apply_fallback_summaries().
+
+    Weak interactions are truncated/batched right away, and each batch is submitted to
+    `executor`. Returns {interaction index: future}; a future resolves once that
+    interaction's text has been improved. Strong interactions are absent from the map,
+    so callers can start extracting them immediately.
+    """
+    if not cfg.enable_fallback_summarizer:
+        return {}
+    if not api_key:
+        return {}
+
+    summarizer = FallbackSummarizer(
+        api_key=api_key,
+        model=fallback_model,
+        max_object_chars=cfg.max_interaction_chars * 4,
+        max_summary_chars=cfg.max_interaction_chars,
+    )
+
+    pending: Dict[int, Future[None]] = {}
+    for batch in _weak_batches(interactions, cfg):
+        fut = executor.submit(
+            _summarize_into,
+            summarizer,
+            [interactions[i] for i in batch],
+            cfg.max_interaction_chars,
+        )
+        for i in batch:
+            pending[i] = fut
+    return pending
 
 
 # ---------------------------------------------------------------------------
@@ -429,9 +733,8 @@ def ingest(
         fallback_model=fallback_model,
     )
 
-    # record sources on passport
-    for s in sources:
-        passport.upsert_source(s)
+    # record sources on passport (unique by id)
+    passport.upsert_sources(sources)
 
     passport.touch()
     return passport, interactions
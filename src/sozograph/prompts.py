@@ -76,7 +76,7 @@ Your job is to produce a compact human-readable summary string that captures the
 without dumping raw blobs or irrelevant IDs.
 
 Rules:
-- Output plain text ONLY (no JSON, no markdown).
+- Output JSON ONLY: {"summary": "..."}. The summary itself is plain text (no markdown).
 - Keep it short (2-8 lines max).
 - Focus on human meaning: who/what/when/status/decision/outcome.
 - Avoid internal IDs unless they are meaningful to a human.
@@ -93,4 +93,33 @@ OBJECT (JSON):
 
 TASK:
 Write a compact summary suitable for an AI memory system.
+Return JSON ONLY with this shape:
+{{"summary": "..."}}
+"""
+
+
+FALLBACK_SUMMARIZER_BATCH_SYSTEM_PROMPT = """
+You are SozoGraph Fallback Summarizer v1 (batch mode).
+
+You are given a JSON array of arbitrary objects from a database (Firestore / RTDB / Supabase).
+For EACH object, produce a compact human-readable summary string that captures the meaning
+without dumping raw blobs or irrelevant IDs.
+
+Rules:
+- Output JSON ONLY, matching the requested shape. Summary texts are plain text (no markdown).
+- Exactly one summary per input object, keyed by the object's "i".
+- Keep each summary short (2-8 lines max).
+- Focus on human meaning: who/what/when/status/decision/outcome.
+- Avoid internal IDs unless they are meaningful to a human.
+- If an object is mostly noise, say what it represents at a high level.
+"""
+
+FALLBACK_SUMMARIZER_BATCH_USER_PROMPT_TEMPLATE = """
+OBJECTS (JSON array; each item has i, source_hint, source_pointer, ts_iso, object):
+{objects_json}
+
+TASK:
+Write a compact summary of each object, suitable for an AI memory system.
+Return JSON ONLY with this shape:
+{{"summaries": [{{"i": 0, "text": "..."}}]}}
 """
@@ -1,23 +1,46 @@
 from __future__ import annotations
 
-from typing import Any, List, Tuple
+import heapq
+from operator import attrgetter
+from typing import Any, Callable, Dict, List, Tuple
 
 from .schema import Passport, Fact, Preference, Entity, OpenLoop, Contradiction
 from .utils import normalize_key
 
 
+def _null_to_str(v: Any) -> str:
+    return "null"
+
+
+def _bool_to_str(v: Any) -> str:
+    return "true" if v else "false"
+
+
+# Exact-type dispatch for the common JSON scalars (one dict lookup instead of an isinstance chain)
+_VAL_TO_STR: Dict[type, Callable[[Any], str]] = {
+    str: str.strip,
+    int: str,
+    float: str,
+    bool: _bool_to_str,
+    type(None): _null_to_str,
+}
+
+
+def _val_to_str_slow(v: Any) -> str:
+    # Subclasses (IntEnum, str enums, ...) keep the isinstance semantics
+    if isinstance(v, bool):
+        return _bool_to_str(v)
+    if isinstance(v, (int, float)):
+        return str(v)
+    if isinstance(v, str):
+        return v.strip()
+    # compact repr for simple JSON-ish values
+    return str(v)
+
+
 def _val_to_str(v: Any, max_len: int = 220) -> str:
-    if v is None:
-        s = "null"
-    elif isinstance(v, bool):
-        s = "true" if v else "false"
-    elif isinstance(v, (int, float)):
-        s = str(v)
-    elif isinstance(v, str):
-        s = v.strip()
-    else:
-        # compact repr for simple JSON-ish values
-        s = str(v)
+    fn = _VAL_TO_STR.get(type(v))
+    s = fn(v) if fn is not None else _val_to_str_slow(v)
 
     if len(s) > max_len:
         return s[: max_len - 1] + "…"
@@ -34,24 +57,26 @@ def _score_item(ts, confidence: float) -> float:
     return (t / 1_000_000_000.0) + (confidence * 0.5)
 
 
+# heapq.nlargest(n, ...) == sorted(..., reverse=True)[:n] (ties keep input order),
+# without fully sorting sections that are much larger than what gets rendered.
 def _pick_top_facts(facts: List[Fact], n: int) -> List[Fact]:
-    ranked = sorted(facts, key=lambda f: _score_item(f.ts, float(f.confidence)), reverse=True)
-    return ranked[:n]
+    return heapq.nlargest(n, facts, key=lambda f: _score_item(f.ts, f.confidence))
 
 
 def _pick_top_prefs(prefs: List[Preference], n: int) -> List[Preference]:
-    ranked = sorted(prefs, key=lambda p: _score_item(p.ts, float(p.confidence)), reverse=True)
-    return ranked[:n]
+    return heapq.nlargest(n, prefs, key=lambda p: _score_item(p.ts, p.confidence))
+
+
+_BY_TS = attrgetter("ts")
+_BY_TS_NEW = attrgetter("ts_new")
 
 
 def _pick_top_open_loops(open_loops: List[OpenLoop], n: int) -> List[OpenLoop]:
-    ranked = sorted(open_loops, key=lambda o: o.ts, reverse=True)
-    return ranked[:n]
+    return heapq.nlargest(n, open_loops, key=_BY_TS)
 
 
 def _pick_top_contradictions(contradictions: List[Contradiction], n: int) -> List[Contradiction]:
-    ranked = sorted(contradictions, key=lambda c: c.ts_new, reverse=True)
-    return ranked[:n]
+    return heapq.nlargest(n, contradictions, key=_BY_TS_NEW)
 
 
 def _entities_summary(entities: List[Entity], max_items: int = 12) -> List[str]:
@@ -65,6 +90,11 @@ def _entities_summary(entities: List[Entity], max_items: int = 12) -> List[str]:
     return out
 
 
+# (section index, minimum items kept) in trim order; indexes follow the render order
+# facts, prefs, entities, open loops, contradictions.
+_TRIM_ORDER: Tuple[Tuple[int, int], ...] = ((4, 0), (3, 0), (2, 0), (1, 0), (0, 5))
+
+
 def export_context(
     passport: Passport,
     *,
@@ -89,129 +119,55 @@ def export_context(
     contradictions = _pick_top_contradictions(passport.contradictions, n=8)
     entities = passport.entities or []
 
-    lines: List[str] = []
-    lines.append(header)
+    head: List[str] = [header]
     if passport.user_key:
-        lines.append(f"User: {passport.user_key}")
-    lines.append(f"Updated: {passport.updated_at.isoformat()}")
-
-    # Facts
-    if facts:
-        lines.append("")
-        lines.append("Facts (current beliefs):")
-        for f in facts:
-            lines.append(f"- {normalize_key(f.key)}: {_val_to_str(f.value)}")
-
-    # Preferences
-    if prefs:
-        lines.append("")
-        lines.append("Preferences:")
-        for p in prefs:
-            lines.append(f"- {normalize_key(p.key)}: {_val_to_str(p.value)}")
-
-    # Entities
-    ent_lines = _entities_summary(entities)
-    if ent_lines:
-        lines.append("")
-        lines.append("Key entities:")
-        for s in ent_lines:
-            lines.append(f"- {s}")
-
-    # Open loops
-    if open_loops:
-        lines.append("")
-        lines.append("Open loops:")
-        for o in open_loops:
-            lines.append(f"- {_val_to_str(o.item, max_len=240)}")
-
-    # Contradictions
-    if contradictions:
-        lines.append("")
-        lines.append("Recent updates (contradictions resolved by time):")
-        for c in contradictions:
-            lines.append(
+        head.append(f"User: {passport.user_key}")
+    head.append(f"Updated: {passport.updated_at.isoformat()}")
+
+    # Each line is rendered once; trimming only drops lines from the tail of a section.
+    sections: List[Tuple[str, List[str]]] = [
+        ("Facts (current beliefs):", [f"- {normalize_key(f.key)}: {_val_to_str(f.value)}" for f in facts]),
+        ("Preferences:", [f"- {normalize_key(p.key)}: {_val_to_str(p.value)}" for p in prefs]),
+        ("Key entities:", [f"- {s}" for s in _entities_summary(entities)]),
+        ("Open loops:", [f"- {_val_to_str(o.item, max_len=240)}" for o in open_loops]),
+        (
+            "Recent updates (contradictions resolved by time):",
+            [
                 f"- {normalize_key(c.key)} changed: {_val_to_str(c.old)} -> {_val_to_str(c.new)}"
-            )
-
-    # Budget enforcement (trim bottom-up)
-    def join_len(ls: List[str]) -> int:
-        return len("\n".join(ls))
-
-    # If over budget, progressively trim sections by reducing item counts
-    if join_len(lines) > budget_chars:
-        # Helper to rebuild with smaller caps
-        def rebuild(f_n: int, p_n: int, e_n: int, o_n: int, c_n: int) -> List[str]:
-            f2 = _pick_top_facts(passport.facts, n=f_n)
-            p2 = _pick_top_prefs(passport.prefs, n=p_n)
-            o2 = _pick_top_open_loops(passport.open_loops, n=o_n)
-            c2 = _pick_top_contradictions(passport.contradictions, n=c_n)
-            e2 = passport.entities[:e_n] if passport.entities else []
-
-            out: List[str] = []
-            out.append(header)
-            if passport.user_key:
-                out.append(f"User: {passport.user_key}")
-            out.append(f"Updated: {passport.updated_at.isoformat()}")
-
-            if f2:
-                out.append("")
-                out.append("Facts (current beliefs):")
-                for f in f2:
-                    out.append(f"- {normalize_key(f.key)}: {_val_to_str(f.value)}")
-
-            if p2:
-                out.append("")
-                out.append("Preferences:")
-                for p in p2:
-                    out.append(f"- {normalize_key(p.key)}: {_val_to_str(p.value)}")
-
-            ent2 = _entities_summary(e2, max_items=e_n)
-            if ent2:
-                out.append("")
-                out.append("Key entities:")
-                for s in ent2:
-                    out.append(f"- {s}")
-
-            if o2:
-                out.append("")
-                out.append("Open loops:")
-                for o in o2:
-                    out.append(f"- {_val_to_str(o.item, max_len=240)}")
-
-            if c2:
-                out.append("")
-                out.append("Recent updates (contradictions resolved by time):")
-                for c in c2:
-                    out.append(
-                        f"- {normalize_key(c.key)} changed: {_val_to_str(c.old)} -> {_val_to_str(c.new)}"
-                    )
-
-            return out
-
-        # Start trimming least important first: contradictions, open loops, entities, prefs, facts
-        caps = [25, 15, 12, 10, 8]  # f, p, e, o, c
-        for _ in range(80):
-            if join_len(lines) <= budget_chars:
+                for c in contradictions
+            ],
+        ),
+    ]
+
+    # Budget enforcement (trim bottom-up), tracked as a running length of the joined text.
+    # A non-empty section costs "\n" + "" + "\n" + title, plus "\n" + line per item.
+    total = len("\n".join(head)) + sum(
+        len(title) + 2 + sum(len(ln) + 1 for ln in sec_lines)
+        for title, sec_lines in sections
+        if sec_lines
+    )
+
+    # If over budget, progressively trim sections by reducing item counts:
+    # contradictions, open loops, entities, prefs, then facts (down to 5)
+    if total > budget_chars:
+        for idx, floor in _TRIM_ORDER:
+            title, sec_lines = sections[idx]
+            while total > budget_chars and len(sec_lines) > floor:
+                total -= len(sec_lines.pop()) + 1
+                if not sec_lines:
+                    total -= len(title) + 2
+            if total <= budget_chars:
                 break
 
-            # pick a trim step
-            f_n, p_n, e_n, o_n, c_n = caps
-            if c_n > 0:
-                c_n = max(0, c_n - 1)
-            elif o_n > 0:
-                o_n = max(0, o_n - 1)
-            elif e_n > 0:
-                e_n = max(0, e_n - 1)
-            elif p_n > 0:
-                p_n = max(0, p_n - 1)
-            elif f_n > 5:
-                f_n = max(5, f_n - 1)
-            else:
-                # last resort: hard truncate joined text
-                txt = "\n".join(lines)
-                return txt[: budget_chars - 1] + "…"
-
-            caps = [f_n, p_n, e_n, o_n, c_n]
-            lines = rebuild(f_n, p_n, e_n, o_n, c_n)
-
-    return "\n".join(lines)
+    lines = head
+    for title, sec_lines in sections:
+        if sec_lines:
+            lines.append("")
+            lines.append(title)
+            lines.extend(sec_lines)
+    txt = "\n".join(lines)
+
+    if total > budget_chars:
+        # last resort: hard truncate joined text
+        return txt[: budget_chars - 1] + "…"
+    return txt
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+from bisect import insort
 from dataclasses import dataclass
+from functools import lru_cache
+from operator import lt
 from typing import Any, Dict, List, Optional, Tuple
 
 from .schema import (
@@ -14,6 +17,8 @@ from .schema import (
 from .utils import normalize_key
 
 
+# Cached: passports repeat the same few dozen keys/names across every merge and sort
+@lru_cache(maxsize=4096)
 def _norm_key(key: str) -> str:
     # Canonical key identity for truth-layer merges
     return (key or "").strip().lower()
@@ -32,11 +37,14 @@ def _value_equal(a: Any, b: Any) -> bool:
     # JSON-ish equality with simple normalization
     if a is b:
         return True
-    if isinstance(a, str) and isinstance(b, str):
+    # Exact type checks: validated JSONValue strings are always plain str
+    # (pydantic coerces str subclasses/enums), and this skips isinstance for other scalars.
+    if type(a) is str and type(b) is str:
         return a.strip() == b.strip()
     return a == b
 
 
+@lru_cache(maxsize=4096)
 def _entity_key(name: str) -> str:
     return (name or "").strip().lower()
 
@@ -44,7 +52,7 @@ def _entity_key(name: str) -> str:
 def _merge_entity(existing: Entity, incoming: Entity) -> Entity:
     # Prefer existing name/type; merge aliases + include the other name as alias if different
     aliases = list(existing.aliases)
-    seen = {a.lower(): True for a in aliases}
+    seen = {a.lower() for a in aliases}
 
     def add_alias(x: str) -> None:
         x = (x or "").strip()
@@ -53,11 +61,11 @@ def _merge_entity(existing: Entity, incoming: Entity) -> Entity:
         k = x.lower()
         if k in seen:
             return
-        seen[k] = True
+        seen.add(k)
         aliases.append(x)
 
     # cross-add names as aliases if different
-    if existing.name.strip().lower() != incoming.name.strip().lower():
+    if _entity_key(existing.name) != _entity_key(incoming.name):
         add_alias(incoming.name)
 
     for a in incoming.aliases:
@@ -74,6 +82,7 @@ def _merge_entity(existing: Entity, incoming: Entity) -> Entity:
 def _upsert_kv_with_temporal_priority(
     *,
     items: List[Any],  # list[Fact] or list[Preference]
+    index: Dict[str, int],  # normalized key -> position in items (see _key_index)
     incoming: Any,  # Fact or Preference
     contradictions: List[Contradiction],
     is_fact: bool,
@@ -83,23 +92,23 @@ def _upsert_kv_with_temporal_priority(
     Returns (updated, contradiction_or_none).
     """
     # IMPORTANT: normalize incoming key to prevent "Tone" vs "tone" duplication
+    # (pydantic __setattr__ is ~4x a plain read, so only write keys that actually change)
     key = _norm_key(incoming.key)
-    incoming.key = key
+    if incoming.key != key:
+        incoming.key = key
 
-    idx = None
-    for i, it in enumerate(items):
-        if _norm_key(it.key) == key:
-            idx = i
-            break
+    idx = index.get(key)
 
     if idx is None:
+        index[key] = len(items)
         items.append(incoming)
         return True, None
 
     current = items[idx]
 
     # Always canonicalize stored key once matched (fixes "Tone" lingering forever)
-    current.key = key
+    if current.key != key:
+        current.key = key
 
     # If value same, keep the most recent ts/confidence optionally
     if _value_equal(current.value, incoming.value):
@@ -107,9 +116,8 @@ def _upsert_kv_with_temporal_priority(
         if incoming.ts > current.ts:
             current.ts = incoming.ts
             current.source = incoming.source
-        if float(incoming.confidence) > float(current.confidence):
-            current.confidence = float(incoming.confidence)
-        items[idx] = current
+        if incoming.confidence > current.confidence:
+            current.confidence = incoming.confidence
         return False, None
 
     # Value differs: temporal priority
@@ -139,28 +147,76 @@ def _upsert_kv_with_temporal_priority(
         source_new=current.source,
     )
     contradictions.append(c)
-    items[idx] = current
     return False, c
 
 
-def _dedupe_open_loops(existing: List[OpenLoop], incoming: OpenLoop) -> bool:
+def _key_index(items: List[Any]) -> Dict[str, int]:
+    # First occurrence wins, matching the linear scan this replaces
+    index: Dict[str, int] = {}
+    for i, it in enumerate(items):
+        index.setdefault(_norm_key(it.key), i)
+    return index
+
+
+def _kv_sort_key(x: Any) -> Tuple[str, float]:
+    return (_norm_key(x.key), -x.ts.timestamp())
+
+
+def _restore_kv_order(items: List[Any], index: Dict[str, int], start: int) -> None:
+    """
+    Re-sort facts/prefs after upserts; items[:start] are the ones present before the merge.
+
+    With unique keys an upsert never moves an existing item (its key, the primary sort
+    field, is unchanged), so if items[:start] was already sorted only the items appended
+    past `start` need placing. Those are bisected in while there are few of them.
+    Duplicate keys, or a prefix out of order (hand-built or loaded passports), fall back
+    to a full sort.
+    """
+    if len(index) != len(items):
+        items.sort(key=_kv_sort_key)
+        return
+    # With unique keys, index lists the normalized keys in item order (see _key_index),
+    # so the sortedness check is a linear string compare with no key recomputation.
+    keys = list(index)[:start]
+    if not all(map(lt, keys, keys[1:])):
+        items.sort(key=_kv_sort_key)
+        return
+    new = items[start:]
+    if not new:
+        return
+    if len(new) * 16 > len(items):
+        items.sort(key=_kv_sort_key)
+        return
+    del items[start:]
+    for it in new:
+        insort(items, it, key=_kv_sort_key)
+
+
+# Cached like _norm_key: every merge with new open loops re-indexes the stored ones
+@lru_cache(maxsize=4096)
+def _norm_loop(item: str) -> str:
+    return " ".join((item or "").strip().lower().split())
+
+
+def _dedupe_open_loops(existing: List[OpenLoop], index: Dict[str, int], incoming: OpenLoop) -> bool:
     """
     Light dedupe: same normalized text -> keep newest.
+    `index` maps normalized text -> position in `existing` and is kept up to date.
     Returns True if added/updated.
     """
-    norm = " ".join((incoming.item or "").strip().lower().split())
+    norm = _norm_loop(incoming.item)
     if not norm:
         return False
 
-    for i, loop in enumerate(existing):
-        norm2 = " ".join((loop.item or "").strip().lower().split())
-        if norm2 == norm:
-            # keep the newest ts
-            if incoming.ts > loop.ts:
-                existing[i] = incoming
-                return True
-            return False
+    i = index.get(norm)
+    if i is not None:
+        # keep the newest ts
+        if incoming.ts > existing[i].ts:
+            existing[i] = incoming
+            return True
+        return False
 
+    index[norm] = len(existing)
     existing.append(incoming)
     return True
 
@@ -176,93 +232,121 @@ def merge_passport_update(
     """
     Deterministically merge an extractor update into a passport.
     """
-    stats = ResolveStats()
+    # Plain local counters in the loops; ResolveStats is built once at the end
+    facts_upserted = prefs_upserted = entities_merged = open_loops_added = contradictions_added = 0
+
+    # Each section's lookup indexes cost O(len(section)) to build, so sections that
+    # received no input are skipped entirely. Every merge leaves all sections sorted,
+    # so untouched ones also stay in order.
 
     # Facts
-    for f in facts:
-        updated, c = _upsert_kv_with_temporal_priority(
-            items=base.facts,
-            incoming=f,
-            contradictions=base.contradictions,
-            is_fact=True,
-        )
-        if updated:
-            stats.facts_upserted += 1
-        if c is not None:
-            stats.contradictions_added += 1
+    if facts:
+        facts_start = len(base.facts)
+        facts_idx = _key_index(base.facts)
+        for f in facts:
+            updated, c = _upsert_kv_with_temporal_priority(
+                items=base.facts,
+                index=facts_idx,
+                incoming=f,
+                contradictions=base.contradictions,
+                is_fact=True,
+            )
+            if updated:
+                facts_upserted += 1
+            if c is not None:
+                contradictions_added += 1
+        _restore_kv_order(base.facts, facts_idx, facts_start)
 
     # Preferences
-    for p in prefs:
-        updated, c = _upsert_kv_with_temporal_priority(
-            items=base.prefs,
-            incoming=p,
-            contradictions=base.contradictions,
-            is_fact=False,
-        )
-        if updated:
-            stats.prefs_upserted += 1
-        if c is not None:
-            stats.contradictions_added += 1
+    if prefs:
+        prefs_start = len(base.prefs)
+        prefs_idx = _key_index(base.prefs)
+        for p in prefs:
+            updated, c = _upsert_kv_with_temporal_priority(
+                items=base.prefs,
+                index=prefs_idx,
+                incoming=p,
+                contradictions=base.contradictions,
+                is_fact=False,
+            )
+            if updated:
+                prefs_upserted += 1
+            if c is not None:
+                contradictions_added += 1
+        _restore_kv_order(base.prefs, prefs_idx, prefs_start)
 
     # Entities (merge by name key, also check aliases overlap)
-    entity_map: Dict[str, Entity] = {_entity_key(e.name): e for e in base.entities}
-    # Build alias index to catch "Sozo Graph" vs "SozoGraph"
-    alias_index: Dict[str, str] = {}
-    for e in base.entities:
-        k = _entity_key(e.name)
-        for a in e.aliases:
-            alias_index[_entity_key(a)] = k
-
-    for inc in entities:
-        inc_name_k = _entity_key(inc.name)
-        target_k = None
-
-        if inc_name_k in entity_map:
-            target_k = inc_name_k
-        elif inc_name_k in alias_index:
-            target_k = alias_index[inc_name_k]
-        else:
-            # Try matching by any incoming alias
-            for a in inc.aliases:
+    if entities:
+        entity_map: Dict[str, Entity] = {_entity_key(e.name): e for e in base.entities}
+        # Position of each name key in base.entities (first occurrence, as the old rescan found)
+        entity_idx: Dict[str, int] = {}
+        for i, e in enumerate(base.entities):
+            entity_idx.setdefault(_entity_key(e.name), i)
+        # One lookup table for names and aliases (catches "Sozo Graph" vs "SozoGraph"):
+        # normalized token -> canonical entity key. Names win over aliases; among aliases
+        # the most recently indexed entity wins.
+        token_index: Dict[str, str] = {}
+        for e in base.entities:
+            k = _entity_key(e.name)
+            for a in e.aliases:
+                token_index[_entity_key(a)] = k
+        for k in entity_map:
+            token_index[k] = k
+
+        def index_aliases(aliases: List[str], k: str) -> None:
+            for a in aliases:
                 ak = _entity_key(a)
-                if ak in entity_map:
-                    target_k = ak
-                    break
-                if ak in alias_index:
-                    target_k = alias_index[ak]
-                    break
-
-        if target_k is None:
-            base.entities.append(inc)
-            entity_map[inc_name_k] = inc
-            # add aliases to index
-            for a in inc.aliases:
-                alias_index[_entity_key(a)] = inc_name_k
-            stats.entities_merged += 1
-        else:
-            merged = _merge_entity(entity_map[target_k], inc)
-            entity_map[target_k] = merged
-            # rehydrate base.entities list item
-            for i, e in enumerate(base.entities):
-                if _entity_key(e.name) == target_k:
-                    base.entities[i] = merged
-                    break
-            # refresh alias index with merged aliases
-            for a in merged.aliases:
-                alias_index[_entity_key(a)] = target_k
-            stats.entities_merged += 1
-
-    # Open loops
-    for o in open_loops:
-        if _dedupe_open_loops(base.open_loops, o):
-            stats.open_loops_added += 1
-
-    # Keep deterministic ordering: sort facts/prefs by key, then ts desc
-    base.facts.sort(key=lambda x: (_norm_key(x.key), -x.ts.timestamp()))
-    base.prefs.sort(key=lambda x: (_norm_key(x.key), -x.ts.timestamp()))
-    base.entities.sort(key=lambda x: (_entity_key(x.name), x.type))
-    base.open_loops.sort(key=lambda x: (-x.ts.timestamp(), (x.item or "").lower()))
-    base.contradictions.sort(key=lambda x: (_norm_key(x.key), -x.ts_new.timestamp()))
+                if ak not in entity_map:
+                    token_index[ak] = k
+
+        for inc in entities:
+            inc_name_k = _entity_key(inc.name)
+            target_k = token_index.get(inc_name_k)
+            if target_k is None:
+                # Try matching by any incoming alias
+                for a in inc.aliases:
+                    target_k = token_index.get(_entity_key(a))
+                    if target_k is not None:
+                        break
+
+            if target_k is None:
+                entity_idx[inc_name_k] = len(base.entities)
+                base.entities.append(inc)
+                entity_map[inc_name_k] = inc
+                token_index[inc_name_k] = inc_name_k
+                index_aliases(inc.aliases, inc_name_k)
+                entities_merged += 1
+            else:
+                merged = _merge_entity(entity_map[target_k], inc)
+                entity_map[target_k] = merged
+                # rehydrate base.entities list item
+                base.entities[entity_idx[target_k]] = merged
+                # refresh alias index with merged aliases
+                index_aliases(merged.aliases, target_k)
+                entities_merged += 1
+        base.entities.sort(key=lambda x: (_entity_key(x.name), x.type))
+
+    # Open loops (first occurrence wins, as with the linear scan this replaces)
+    if open_loops:
+        loop_idx: Dict[str, int] = {}
+        for i, loop in enumerate(base.open_loops):
+            loop_idx.setdefault(_norm_loop(loop.item), i)
+        for o in open_loops:
+            if _dedupe_open_loops(base.open_loops, loop_idx, o):
+                open_loops_added += 1
+        base.open_loops.sort(key=lambda x: (-x.ts.timestamp(), (x.item or "").lower()))
+
+    # Keep deterministic ordering: facts/prefs by key, then ts desc (restored above),
+    # contradictions likewise by key, newest first.
+    if contradictions_added:
+        base.contradictions.sort(key=lambda x: (_norm_key(x.key), -x.ts_new.timestamp()))
 
     base.touch()
+    stats = ResolveStats(
+        facts_upserted=facts_upserted,
+        prefs_upserted=prefs_upserted,
+        entities_merged=entities_merged,
+        open_loops_added=open_loops_added,
+        contradictions_added=contradictions_added,
+    )
     return base, stats
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Literal, Optional, Union
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Literal, Optional, Union
 
 from pydantic import BaseModel, Field, ConfigDict, field_validator
 
@@ -14,8 +15,15 @@ def utcnow() -> datetime:
 
 
 def _iso(dt: datetime) -> str:
-    # Always serialize as ISO-8601 with timezone
-    if dt.tzinfo is None:
+    # Always serialize as ISO-8601 with timezone.
+    # tzinfo is part of the cache key: aware datetimes for the same instant in different
+    # zones compare (and hash) equal but format differently.
+    return _iso_cached(dt, dt.tzinfo)
+
+
+@lru_cache(maxsize=8192)
+def _iso_cached(dt: datetime, tz: Any) -> str:
+    if tz is None:
         dt = dt.replace(tzinfo=timezone.utc)
     return dt.isoformat()
 
@@ -237,5 +245,21 @@ class Passport(BaseModel):
                 return
         self.sources.append(src)
 
+    def upsert_sources(self, srcs: Iterable[SourceRef]) -> None:
+        """
+        upsert_source() for many refs: one id index per call instead of a scan per ref.
+        The index is local, so direct edits to self.sources can never leave it stale.
+        """
+        index: Dict[str, int] = {}
+        for i, existing in enumerate(self.sources):
+            index.setdefault(existing.id, i)  # first match, like upsert_source
+        for src in srcs:
+            i = index.get(src.id)
+            if i is None:
+                index[src.id] = len(self.sources)
+                self.sources.append(src)
+            else:
+                self.sources[i] = src
+
     def touch(self) -> None:
         self.updated_at = utcnow()
@@ -2,9 +2,15 @@ from __future__ import annotations
 
 import hashlib
 import json
-import re
 from datetime import datetime, timezone
-from typing import Any, Dict, Iterable, Optional
+from functools import lru_cache
+from string import Formatter
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+try:  # optional speedup: pip install "sozograph[fast]"
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None
 
 
 # -----------------------------
@@ -30,57 +36,194 @@ def parse_ts(value: Any) -> Optional[datetime]:
     if isinstance(value, datetime):
         return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
 
+    if isinstance(value, (str, int, float)):
+        # Batches repeat the same stamps a lot; results are immutable so they can be shared.
+        return _parse_scalar_ts(value)
+
+    return None
+
+
+_UTC = timezone.utc
+# Heuristic: > 10^12 is probably ms
+_MS_THRESHOLD = 1_000_000_000_000
+# Unix seconds representable as an aware datetime (years 1..9999)
+_MIN_UNIX_S = -62_135_596_800
+_MAX_UNIX_S = 253_402_300_799
+
+
+@lru_cache(maxsize=8192)
+def _parse_scalar_ts(value: Union[str, int, float]) -> Optional[datetime]:
     if isinstance(value, (int, float)):
-        # Heuristic: > 10^12 is probably ms
+        if value > _MS_THRESHOLD:
+            if type(value) is int:
+                # exact integer split; no float rounding of the ms part
+                sec, ms = divmod(value, 1000)
+                if sec > _MAX_UNIX_S:
+                    return None
+                return datetime.fromtimestamp(sec, tz=_UTC).replace(microsecond=ms * 1000)
+            value = value / 1000
+        # Range check up front instead of relying on fromtimestamp raising (also rejects NaN)
+        if not (_MIN_UNIX_S <= value <= _MAX_UNIX_S):
+            return None
         try:
-            if value > 1_000_000_000_000:
-                return datetime.fromtimestamp(value / 1000, tz=timezone.utc)
-            return datetime.fromtimestamp(value, tz=timezone.utc)
-        except Exception:
+            return datetime.fromtimestamp(value, tz=_UTC)
+        except (OverflowError, OSError, ValueError):  # platform limits (e.g. negative on Windows)
             return None
 
-    if isinstance(value, str):
+    try:
         try:
+            # Python 3.11+ parses a "Z" suffix natively, so no rewritten copy is needed
+            dt = datetime.fromisoformat(value)
+        except ValueError:
+            # 3.10, and forms such as "2026-02-03Z" that only parse once "Z" is rewritten
+            if "Z" not in value:
+                return None
             dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
-            return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
-        except Exception:
-            return None
-
-    return None
+        return dt if dt.tzinfo else dt.replace(tzinfo=_UTC)
+    except Exception:
+        return None
 
 
 # -----------------------------
 # Key normalization
 # -----------------------------
 
-_KEY_RE = re.compile(r"[^a-z0-9]+")
+class _KeyCharMap(dict):
+    """
+    str.translate table: keeps [a-z0-9], maps every other code point to "_".
+    ASCII is prebuilt; other code points are filled in on first sight.
+    """
+
+    def __missing__(self, codepoint: int) -> int:
+        self[codepoint] = _UNDERSCORE
+        return _UNDERSCORE
+
+
+_UNDERSCORE = ord("_")
+_KEY_TABLE = _KeyCharMap(
+    (c, c if chr(c) in "abcdefghijklmnopqrstuvwxyz0123456789" else _UNDERSCORE)
+    for c in range(128)
+)
 
 
+@lru_cache(maxsize=2048)
 def normalize_key(value: str) -> str:
     """
     Normalize keys to stable snake_case-ish lowercase tokens.
+    Cached: the same handful of keys is normalized on every extract/merge/render.
     """
     if not value:
         return ""
-    value = value.strip().lower()
-    value = _KEY_RE.sub("_", value)
-    value = value.strip("_")
-    return value
+    if value.isascii() and value.isalnum() and value.islower():
+        return value  # already a clean single token
+    value = value.lower().translate(_KEY_TABLE)
+    if "__" in value:
+        # collapse runs of separators (same result as re.sub(r"[^a-z0-9]+", "_", ...))
+        return "_".join(filter(None, value.split("_")))
+    return value.strip("_")
+
+
+# -----------------------------
+# Prompt templates
+# -----------------------------
+
+class PromptTemplate:
+    """
+    A str.format-style template split once into literal chunks and field names.
+
+    render() only concatenates, instead of re-parsing the template on every call.
+    Fields passed as `fixed` at construction are baked into the literal chunks.
+    Only plain {name} fields are supported (no format specs / conversions).
+    """
+
+    __slots__ = ("_literals", "_fields")
+
+    def __init__(self, template: str, **fixed: Any):
+        literals: List[str] = []
+        fields: List[str] = []
+        pending = ""
+        for text, field, spec, conversion in Formatter().parse(template):
+            pending += text
+            if field is None:
+                continue
+            if spec or conversion:
+                raise ValueError(f"Unsupported placeholder in prompt template: {{{field}}}")
+            if field in fixed:
+                pending += str(fixed[field])
+                continue
+            literals.append(pending)
+            fields.append(field)
+            pending = ""
+        literals.append(pending)
+        self._literals = tuple(literals)
+        self._fields = tuple(fields)
+
+    def render(self, **values: Any) -> str:
+        literals = self._literals
+        out = [literals[0]]
+        for i, field in enumerate(self._fields, start=1):
+            out.append(str(values[field]))
+            out.append(literals[i])
+        return "".join(out)
+
+
+# -----------------------------
+# JSON decoding
+# -----------------------------
+
+def json_loads(text: Union[str, bytes]) -> Any:
+    """
+    Decode JSON text, using orjson when it is installed.
+    """
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def json_dumps_compact(obj: Any) -> str:
+    """
+    Compact JSON (no indentation/spaces) for prompts, using orjson when it is installed.
+    Not canonical: never hash this output (see sha256_json).
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except (orjson.JSONEncodeError, TypeError):
+            pass  # e.g. ints beyond 64 bits; the stdlib encoder handles those
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, default=str)
 
 
 # -----------------------------
 # Hashing / evidence
 # -----------------------------
 
+# Built once: json.dumps() with non-default options constructs a new encoder per call.
+# The options must stay as-is; changing them would change every stored hash/id.
+_CANONICAL_ENCODER = json.JSONEncoder(sort_keys=True, ensure_ascii=False, default=str)
+
+
+def _canonical_json(obj: Any) -> str:
+    try:
+        return _CANONICAL_ENCODER.encode(obj)
+    except Exception:
+        return str(obj)
+
+
 def sha256_json(obj: Any) -> str:
     """
     Produce a stable sha256 hash for JSON-serializable objects.
     """
-    try:
-        payload = json.dumps(obj, sort_keys=True, ensure_ascii=False, default=str)
-    except Exception:
-        payload = str(obj)
-    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    return hashlib.sha256(_canonical_json(obj).encode("utf-8")).hexdigest()
+
+
+def fast_id(obj: Any) -> str:
+    """
+    Short (16 hex chars) stable id for JSON-serializable objects.
+
+    Uses blake2b with an 8-byte digest: plenty for dedup ids and cheaper than
+    computing a full sha256 only to slice it. Use sha256_json for evidence hashes.
+    """
+    return hashlib.blake2b(_canonical_json(obj).encode("utf-8"), digest_size=8).hexdigest()
 
 
 # -----------------------------
@@ -137,13 +280,17 @@ def safe_stringify(
 # Field picking helpers
 # -----------------------------
 
+_EMPTY_VALUES = (None, "", [], {})
+
+
 def pick_first(obj: Dict[str, Any], keys: Iterable[str]) -> Optional[Any]:
     """
     Return the first non-empty value for the given keys.
     """
+    # One dict probe per key (missing keys come back as None and are skipped).
+    get = obj.get
     for k in keys:
-        if k in obj:
-            v = obj.get(k)
-            if v not in (None, "", [], {}):
-                return v
+        v = get(k)
+        if v is not None and v not in _EMPTY_VALUES:
+            return v
     return None
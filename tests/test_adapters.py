@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from sozograph.adapters.firestore import firestore_batch_to_interactions, firestore_to_interaction
+from sozograph.adapters.rtdb import rtdb_batch_to_interactions, rtdb_to_interaction
+from sozograph.adapters.supabase import supabase_batch_to_interactions, supabase_row_to_interaction
+
+
+def test_firestore_doc_without_timestamp_or_id():
+    it = firestore_to_interaction({"status": 3, "owner": "u1"}, source="firestore:/apps/a1")
+
+    assert it.text == "3"
+    assert it.type == "firestore"
+    assert len(it.id) == 16
+    assert it.ts.tzinfo is not None
+
+
+def test_firestore_batch_dict_uses_doc_ids_and_paths():
+    its = firestore_batch_to_interactions(
+        {"a1": {"text": "hello", "updatedAt": "2026-02-01T10:00:00Z"}, "a2": {"text": "bye"}},
+        collection_path="apps",
+    )
+
+    assert [it.id for it in its] == ["a1", "a2"]
+    assert [it.source for it in its] == ["firestore:apps/a1", "firestore:apps/a2"]
+    assert its[0].ts.isoformat() == "2026-02-01T10:00:00+00:00"
+
+
+def test_rtdb_scalar_and_batch_paths():
+    it = rtdb_to_interaction(None, path="/users/u1/flag")
+    assert it.text == "None"
+    assert it.id == "_users_u1_flag"
+
+    its = rtdb_batch_to_interactions({"k1": {"text": "x"}, "k2": 5}, base_path="/users/u1")
+    assert [it.source for it in its] == ["rtdb:/users/u1/k1", "rtdb:/users/u1/k2"]
+    assert [it.id for it in its] == ["k1", "k2"]
+
+    its = rtdb_batch_to_interactions(["a", "b"])
+    assert [it.source for it in its] == ["rtdb:0", "rtdb:1"]
+
+
+def test_supabase_row_ids_and_sources():
+    it = supabase_row_to_interaction({"id": 42, "action": "signup"}, table="events")
+    assert it.id == "42"
+    assert it.text == "signup"
+    assert it.source == "supabase:events"
+    assert it.meta == {"table": "events"}
+
+    its = supabase_batch_to_interactions({"r1": {"text": "x"}}, table="events")
+    assert its[0].source == "supabase:events:r1"
+    assert its[0].id == "r1"
+
+
+def test_rtdb_id_falls_back_to_value_hash_only_without_path():
+    a = rtdb_to_interaction({"text": "same"})
+    b = rtdb_to_interaction({"text": "same"})
+
+    assert a.id == b.id
+    assert len(a.id) == 16
+    assert rtdb_to_interaction({"text": "same"}, path="/n/1").id == "_n_1"
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from sozograph.extractor import Extractor
+
+
+def _extractor() -> Extractor:
+    # _validate_and_normalize does not touch the Gemini client
+    return Extractor.__new__(Extractor)
+
+
+def test_validate_and_normalize_skips_malformed_items():
+    data = {
+        "facts": [
+            {"key": "Home City", "value": "Harare", "confidence": 0.9, "ts": "2026-02-01T10:00:00Z"},
+            {"value": "missing key"},
+            "not-a-dict",
+            {"key": "budget", "value": 50000, "confidence": "high"},
+        ],
+        "prefs": [{"key": "Tone", "value": "direct"}],
+        "entities": [{"name": "SozoGraph", "type": "project"}, {"name": "X", "type": "bogus"}],
+        "open_loops": [{"item": "Finalize v1 repo"}],
+    }
+
+    out = _extractor()._validate_and_normalize(data, "t1")
+
+    assert [(f.key, f.value, f.source) for f in out["facts"]] == [("home_city", "Harare", "t1")]
+    assert out["facts"][0].ts.isoformat() == "2026-02-01T10:00:00+00:00"
+    # Missing ts falls back to the model default instead of dropping the item
+    assert [p.key for p in out["prefs"]] == ["tone"]
+    assert [e.name for e in out["entities"]] == ["SozoGraph"]
+    assert [o.item for o in out["open_loops"]] == ["Finalize v1 repo"]
+
+
+def test_extractors_share_one_client_per_api_key():
+    a = Extractor(api_key="test-key-a", model="m")
+    b = Extractor(api_key="test-key-a", model="m")
+    c = Extractor(api_key="test-key-b", model="m")
+
+    assert a.client is b.client
+    assert a.client is not c.client
+
+
+def test_client_transport_keeps_connections_alive():
+    from sozograph.clients import _httpx_client_args
+
+    limits = _httpx_client_args()["limits"]
+    assert limits.keepalive_expiry == 60.0
+    assert limits.max_keepalive_connections == 32
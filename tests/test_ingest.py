@@ -57,3 +57,186 @@ def test_end_to_end_ingest_objects_fire_rtdb_supabase():
 
     ctx = sg.export_context(passport, budget_chars=1800)
     assert "Facts (current beliefs):" in ctx or "Preferences:" in ctx
+
+
+class _FakeModels:
+    def __init__(self, replies):
+        self.replies = list(replies)
+        self.calls = 0
+        self.prompts = []
+
+    def generate_content(self, **kwargs):
+        self.calls += 1
+        self.prompts.append(kwargs["contents"][0].parts[0].text)
+        return type("Resp", (), {"text": self.replies.pop(0)})()
+
+
+def _summarizer(replies):
+    from sozograph.ingest import FallbackSummarizer
+
+    s = FallbackSummarizer(api_key="test-key", model="m")
+    s.client = type("Client", (), {"models": _FakeModels(replies)})()
+    return s
+
+
+def test_summarize_batch_uses_one_call_and_fills_gaps():
+    from sozograph.ingest import SummaryRequest
+
+    s = _summarizer(['{"summaries": [{"i": 1, "text": "second"}, {"i": 0, "text": "first"}]}'])
+    reqs = [SummaryRequest(obj={"a": i}, source_hint="firestore", source_pointer=None, ts_iso="t") for i in range(2)]
+    assert s.summarize_batch(reqs) == ["first", "second"]
+    assert s.client.models.calls == 1
+
+    # Missing entries fall back to a single-object summarize() call
+    s = _summarizer(['{"summaries": [{"i": 0, "text": "first"}]}', '{"summary": "solo"}'])
+    assert s.summarize_batch(reqs) == ["first", "solo"]
+    assert s.client.models.calls == 2
+
+
+def test_summarize_batch_skips_only_malformed_entries():
+    from sozograph.ingest import SummaryRequest
+
+    reply = '{"summaries": [{"i": 0, "text": "first"}, "junk", {"i": "x", "text": "bad"}, {"i": 2, "text": "third"}]}'
+    s = _summarizer([reply, '{"summary": "solo"}'])
+    reqs = [SummaryRequest(obj={"a": i}, source_hint="firestore", source_pointer=None, ts_iso="t") for i in range(3)]
+
+    assert s.summarize_batch(reqs) == ["first", "solo", "third"]
+    assert s.client.models.calls == 2
+
+
+def test_summarize_batch_caps_each_object_in_the_prompt():
+    from sozograph.ingest import SummaryRequest
+
+    s = _summarizer(['{"summaries": [{"i": 0, "text": "a"}, {"i": 1, "text": "b"}]}'])
+    reqs = [
+        SummaryRequest(obj={"rows": list(range(200_000))}, source_hint="firestore", source_pointer=None, ts_iso="t"),
+        SummaryRequest(obj={"title": "small"}, source_hint="firestore", source_pointer=None, ts_iso="t"),
+    ]
+    assert s.summarize_batch(reqs) == ["a", "b"]
+
+    prompt = s.client.models.prompts[0]
+    assert len(prompt) < 2 * s.max_object_chars + 2000
+    assert '"object":{"title":"small"}' in prompt
+
+
+def test_apply_fallback_summaries_runs_batches_concurrently(monkeypatch):
+    import sozograph.ingest as ingest
+    from sozograph.interaction import Interaction
+
+    seen = []
+
+    def fake_batch(self, requests):
+        seen.append(len(requests))
+        return [f"summary of {r.obj['text']}" for r in requests]
+
+    monkeypatch.setattr(ingest.FallbackSummarizer, "summarize_batch", fake_batch)
+    its = [Interaction(type="transcript", text=f"x{i}") for i in range(5)]
+    cfg = ingest.IngestConfig(fallback_batch_size=2, max_concurrency=4)
+
+    out = ingest.apply_fallback_summaries(its, sources=[], api_key="test-key", cfg=cfg)
+
+    assert sorted(seen) == [1, 2, 2]
+    assert [it.text for it in out] == [f"summary of x{i}" for i in range(5)]
+
+
+def test_coerce_dict_hashes_payload_once_for_id_and_source_ref():
+    from sozograph.ingest import coerce_to_interactions
+    from sozograph.utils import sha256_json
+
+    doc = {"id": "d1", "title": "Quarterly plan", "status": "open"}
+    _, sources = coerce_to_interactions(doc, hint="firestore")
+
+    h = sha256_json(doc)
+    assert sources[0].hash == h
+    assert sources[0].id == f"f{h[:12]}"
+
+
+def test_is_text_too_weak_counts_unicode_alphanumerics():
+    from sozograph.ingest import _is_text_too_weak
+
+    assert _is_text_too_weak("")
+    assert _is_text_too_weak("short")
+    assert _is_text_too_weak("{}[]:;,\"'{}[]:;,\"'{}[]:;,\"' ab")
+    assert not _is_text_too_weak("Customer asked about the refund policy today.")
+    assert not _is_text_too_weak("Ẓoë Ñandú habló sobre el presupuesto anual hoy")
+
+
+def test_transcript_source_id_is_stable_content_hash():
+    from sozograph.ingest import coerce_to_interactions
+
+    _, a = coerce_to_interactions("hello there", meta={"source": "chat:1"})
+    _, b = coerce_to_interactions("hello there", meta={"source": "chat:1"})
+    assert a[0].id == b[0].id == f"t{a[0].hash[:12]}"
+
+
+def test_coerce_list_assigns_per_item_source_ids():
+    from sozograph.ingest import coerce_to_interactions
+
+    its, sources = coerce_to_interactions(["first message here", {"id": "d1", "title": "Plan"}, ["nested"]])
+    assert [s.id for s in sources] == ["h_0", "h_1", "h_2"]
+    assert len(its) == 3
+
+    _, sources = coerce_to_interactions(["a", "b"], meta={"source_id": "fixed"})
+    assert [s.id for s in sources] == ["fixed", "fixed"]
+
+
+def test_ingest_async_fallback_extracts_weak_items_after_their_summary(monkeypatch):
+    import sozograph.ingest as ingest
+
+    def fake_batch(self, requests):
+        return ["Summarized: a short but meaningful description of the record."] * len(requests)
+
+    monkeypatch.setattr(ingest.FallbackSummarizer, "summarize_batch", fake_batch)
+
+    sg = SozoGraph(api_key="test-key", max_concurrency=4)
+    seen = {}
+
+    def fake_extract(interaction, source_id):
+        seen[source_id] = interaction.text
+        return {"facts": [], "prefs": [], "entities": [], "open_loops": []}
+
+    monkeypatch.setattr(sg.extractor, "extract", fake_extract)
+
+    strong = "The customer confirmed the delivery address for the March order."
+    _, stats = sg.ingest([strong, "ok"], async_fallback=True)
+
+    assert len(stats) == 2
+    assert seen["i_0"] == strong
+    assert seen["i_1"].startswith("Summarized:")
+
+
+def test_summarizer_object_json_is_compact_and_bounded():
+    s = _summarizer([])
+    s.max_object_chars = 2000
+
+    out = s._object_json({"title": "Plan", "blob": "x" * 5000, "rows": list(range(1000))})
+
+    assert out.startswith('{"title":"Plan","blob":"xxx')
+    assert "x" * 1000 not in out
+    assert len(out) == 2000 and out.endswith("…")
+
+
+def test_load_ingest_config_is_cached_but_returns_copies(monkeypatch):
+    from sozograph.ingest import load_ingest_config, reload_ingest_config
+
+    monkeypatch.setenv("SOZOGRAPH_MAX_CONCURRENCY", "3")
+    assert reload_ingest_config().max_concurrency == 3
+
+    a = load_ingest_config()
+    a.max_concurrency = 99
+    assert load_ingest_config().max_concurrency == 3
+
+    monkeypatch.setenv("SOZOGRAPH_MAX_CONCURRENCY", "5")
+    assert load_ingest_config().max_concurrency == 3
+    assert reload_ingest_config().max_concurrency == 5
+
+    monkeypatch.delenv("SOZOGRAPH_MAX_CONCURRENCY")
+    reload_ingest_config()
+
+
+def test_summarize_reads_structured_summary_and_tolerates_plain_text():
+    kw = dict(source_hint="firestore", source_pointer=None, ts_iso="t")
+
+    assert _summarizer(['{"summary": "  Order shipped.  "}']).summarize({"a": 1}, **kw) == "Order shipped."
+    assert _summarizer(["Order shipped."]).summarize({"a": 1}, **kw) == "Order shipped."
+    assert _summarizer(['{"summary": ""}']).summarize({"a": 1}, **kw) == "Database object (unstructured)."
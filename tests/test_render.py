@@ -62,3 +62,28 @@ def test_export_context_budget_trims():
     # Must not exceed budget by much (allow tiny overhead due to truncation char)
     assert len(txt) <= 910
     assert "Facts (current beliefs):" in txt
+
+
+def test_export_context_trims_contradictions_before_facts():
+    p = Passport(user_key="u1")
+    for i in range(10):
+        p.facts.append(Fact(key=f"fact_{i}", value="v" * 40, ts=dt("2026-02-03T10:00:00Z"), confidence=0.5, source="t1"))
+    for i in range(8):
+        p.contradictions.append(
+            Contradiction(
+                key=f"k{i}",
+                old="a" * 60,
+                new="b" * 60,
+                ts_old=dt("2026-02-01T10:00:00Z"),
+                ts_new=dt("2026-02-03T10:00:00Z"),
+                source_old="t0",
+                source_new="t1",
+            )
+        )
+
+    full = export_context(p, budget_chars=5000)
+    txt = export_context(p, budget_chars=700)
+
+    assert len(txt) <= 700
+    assert "Recent updates" in full and "Recent updates" not in txt
+    assert txt.count("- fact_") == 10
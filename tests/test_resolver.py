@@ -132,3 +132,92 @@ def test_open_loop_dedupe():
     assert len(out.open_loops) == 1
     assert out.open_loops[0].source == "t2"
     assert stats.open_loops_added == 1
+
+
+def test_duplicate_keys_within_one_update_merge_into_one_fact():
+    base = Passport(user_key="u1")
+    base.facts.append(Fact(key="role", value="dev", ts=dt("2026-02-01T10:00:00Z"), source="t0"))
+
+    incoming = [
+        Fact(key="City", value="Harare", ts=dt("2026-02-02T10:00:00Z"), source="t1"),
+        Fact(key="city", value="Bulawayo", ts=dt("2026-02-03T10:00:00Z"), source="t2"),
+    ]
+    out, stats = merge_passport_update(base, facts=incoming, prefs=[], entities=[], open_loops=[])
+
+    assert [(f.key, f.value) for f in out.facts] == [("city", "Bulawayo"), ("role", "dev")]
+    assert stats.facts_upserted == 2
+    assert stats.contradictions_added == 1
+
+
+def test_entity_merge_replaces_the_matching_slot():
+    base = Passport(user_key="u1")
+    base.entities.extend(
+        [Entity(name="Alpha", type="project"), Entity(name="Beta", type="other"), Entity(name="Gamma", type="tool")]
+    )
+
+    out, _ = merge_passport_update(
+        base,
+        facts=[],
+        prefs=[],
+        entities=[Entity(name="beta", type="person", aliases=["B"]), Entity(name="Delta", type="place")],
+        open_loops=[],
+    )
+
+    by_name = {e.name: e for e in out.entities}
+    assert [e.name for e in out.entities] == ["Alpha", "Beta", "Delta", "Gamma"]
+    assert by_name["Beta"].type == "person" and by_name["Beta"].aliases == ["B"]
+
+
+def test_new_facts_are_placed_into_a_sorted_passport():
+    base = Passport(user_key="u1")
+    keys = [f"k{i:02d}" for i in range(0, 80, 2)]
+    base.facts.extend(Fact(key=k, value=k, ts=dt("2026-02-01T10:00:00Z"), source="t0") for k in keys)
+
+    incoming = [
+        Fact(key="k07", value="new", ts=dt("2026-02-02T10:00:00Z"), source="t1"),
+        Fact(key="k02", value="changed", ts=dt("2026-02-02T10:00:00Z"), source="t1"),
+        Fact(key="a", value="first", ts=dt("2026-02-02T10:00:00Z"), source="t1"),
+    ]
+    out, _ = merge_passport_update(base, facts=incoming, prefs=[], entities=[], open_loops=[])
+
+    assert [f.key for f in out.facts] == sorted(keys + ["k07", "a"])
+    assert next(f for f in out.facts if f.key == "k02").value == "changed"
+
+
+def test_duplicate_stored_keys_still_sort_by_newest_first():
+    base = Passport(user_key="u1")
+    base.facts.extend(
+        [
+            Fact(key="tone", value="calm", ts=dt("2026-02-01T10:00:00Z"), source="t0"),
+            Fact(key="tone", value="brief", ts=dt("2026-02-02T10:00:00Z"), source="t1"),
+        ]
+    )
+
+    incoming = [Fact(key="city", value="Harare", ts=dt("2026-02-03T10:00:00Z"), source="t2")]
+    out, _ = merge_passport_update(base, facts=incoming, prefs=[], entities=[], open_loops=[])
+
+    assert [(f.key, f.value) for f in out.facts] == [("city", "Harare"), ("tone", "brief"), ("tone", "calm")]
+
+
+def test_merge_into_unsorted_passport_sorts_the_section():
+    # Hand-built or loaded passports need not be in (key, newest-first) order
+    base = Passport(user_key="u1")
+    keys = [f"k{i:02d}" for i in range(40, 0, -1)]
+    base.facts.extend(Fact(key=k, value=k, ts=dt("2026-02-01T10:00:00Z"), source="t0") for k in keys)
+
+    incoming = [Fact(key="k99", value="new", ts=dt("2026-02-02T10:00:00Z"), source="t1")]
+    out, _ = merge_passport_update(base, facts=incoming, prefs=[], entities=[], open_loops=[])
+
+    assert [f.key for f in out.facts] == sorted(keys + ["k99"])
+
+
+def test_update_only_merge_into_unsorted_passport_sorts_the_section():
+    base = Passport(user_key="u1")
+    base.facts.extend(
+        Fact(key=k, value=k, ts=dt("2026-02-01T10:00:00Z"), source="t0") for k in ("zeta", "alpha", "mid")
+    )
+
+    incoming = [Fact(key="alpha", value="changed", ts=dt("2026-02-02T10:00:00Z"), source="t1")]
+    out, _ = merge_passport_update(base, facts=incoming, prefs=[], entities=[], open_loops=[])
+
+    assert [f.key for f in out.facts] == ["alpha", "mid", "zeta"]
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+from sozograph.schema import _iso
+
+
+def test_iso_cache_keeps_each_timezone_offset():
+    utc = datetime(2026, 2, 3, 10, 0, tzinfo=timezone.utc)
+    plus2 = utc.astimezone(timezone(timedelta(hours=2)))
+
+    assert utc == plus2  # same instant, so the cache must not rely on dt alone
+    assert _iso(utc) == "2026-02-03T10:00:00+00:00"
+    assert _iso(plus2) == "2026-02-03T12:00:00+02:00"
+    assert _iso(datetime(2026, 2, 3, 10, 0)) == "2026-02-03T10:00:00+00:00"
+
+
+def test_upsert_sources_matches_upsert_source():
+    from sozograph.schema import Passport, SourceRef
+
+    refs = [SourceRef(id="a"), SourceRef(id="b"), SourceRef(id="a", hash="h2"), SourceRef(id="c")]
+
+    one_by_one = Passport(sources=[SourceRef(id="b", hash="old")])
+    for r in refs:
+        one_by_one.upsert_source(r)
+
+    batched = Passport(sources=[SourceRef(id="b", hash="old")])
+    batched.upsert_sources(refs)
+
+    assert [s.to_compact() for s in batched.sources] == [s.to_compact() for s in one_by_one.sources]
+    assert [(s.id, s.hash) for s in batched.sources] == [("b", None), ("a", "h2"), ("c", None)]
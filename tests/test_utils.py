@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from sozograph.utils import (
+    PromptTemplate,
+    fast_id,
+    json_dumps_compact,
+    json_loads,
+    normalize_key,
+    parse_ts,
+    pick_first,
+    sha256_json,
+)
+
+
+def test_fast_id_is_short_stable_and_key_order_independent():
+    a = fast_id({"name": "Ada", "role": "engineer"})
+    b = fast_id({"role": "engineer", "name": "Ada"})
+
+    assert a == b
+    assert len(a) == 16
+    assert a != fast_id({"name": "Ada", "role": "manager"})
+
+
+def test_sha256_json_unchanged_for_evidence_hashes():
+    h = sha256_json({"b": 1, "a": [1, 2]})
+    assert len(h) == 64
+    assert h == sha256_json({"a": [1, 2], "b": 1})
+
+
+def test_pick_first_skips_missing_and_empty_values():
+    doc = {"title": "", "notes": [], "summary": None, "status": "open", "name": "x"}
+
+    assert pick_first(doc, ("text", "title", "notes", "summary", "status", "name")) == "open"
+    assert pick_first(doc, ("text", "title")) is None
+    assert pick_first({"count": 0}, ("count",)) == 0
+
+
+def test_json_loads_roundtrip():
+    assert json_loads('{"facts": [{"key": "role", "value": "dev"}]}') == {
+        "facts": [{"key": "role", "value": "dev"}]
+    }
+
+
+def test_normalize_key_snake_cases_and_collapses_separators():
+    assert normalize_key("  Preferred-Language ") == "preferred_language"
+    assert normalize_key("Home  City") == "home_city"
+    assert normalize_key("a__b") == "a_b"
+    assert normalize_key("__budget__max__") == "budget_max"
+    assert normalize_key("Café Owner") == "caf_owner"
+    assert normalize_key("") == ""
+
+
+def test_sha256_json_matches_canonical_stdlib_encoding():
+    import hashlib
+    import json
+
+    obj = {"name": "Zoë", "tags": ["b", "a"], "n": {"y": 2, "x": 1}}
+    expected = hashlib.sha256(
+        json.dumps(obj, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8")
+    ).hexdigest()
+
+    assert sha256_json(obj) == expected
+
+
+def test_parse_ts_supports_iso_unix_seconds_and_ms():
+    from datetime import datetime, timezone
+
+    expected = datetime(2026, 2, 3, 10, 0, tzinfo=timezone.utc)
+
+    assert parse_ts("2026-02-03T10:00:00Z") == expected
+    assert parse_ts("2026-02-03T10:00:00") == expected
+    assert parse_ts(int(expected.timestamp())) == expected
+    assert parse_ts(int(expected.timestamp() * 1000)) == expected
+    assert parse_ts(datetime(2026, 2, 3, 10, 0)) == expected
+    assert parse_ts("not a date") is None
+    assert parse_ts({"ts": 1}) is None
+    assert parse_ts(int(expected.timestamp() * 1000) + 123).microsecond == 123_000
+    assert parse_ts(10**20) is None
+    assert parse_ts(float("nan")) is None
+    assert parse_ts("2026-02-03T12:00:00+02:00") == expected
+    assert parse_ts("2026-02-03Z") == datetime(2026, 2, 3, tzinfo=timezone.utc)
+
+
+def test_prompt_template_matches_str_format():
+    from sozograph.prompts import EXTRACTOR_JSON_SCHEMA, EXTRACTOR_USER_PROMPT_TEMPLATE
+
+    values = {
+        "source_id": "t1",
+        "interaction_type": "transcript",
+        "ts_iso": "2026-02-03T10:00:00+00:00",
+        "interaction_text": "I moved to {Bulawayo}.",
+    }
+    tpl = PromptTemplate(EXTRACTOR_USER_PROMPT_TEMPLATE, schema=EXTRACTOR_JSON_SCHEMA.strip())
+
+    assert tpl.render(**values) == EXTRACTOR_USER_PROMPT_TEMPLATE.format(
+        schema=EXTRACTOR_JSON_SCHEMA.strip(), **values
+    )
+    assert PromptTemplate("{{literal}} {x}").render(x=1) == "{literal} 1"
+
+
+def test_json_dumps_compact_round_trips_and_tolerates_odd_values():
+    from datetime import datetime, timezone
+
+    obj = {"name": "Zoë", 1: "int key", "big": 2**70, "nested": {"a": [1, 2]}}
+    out = json_dumps_compact(obj)
+    assert "Zoë" in out
+    assert ": " not in out and "\n" not in out
+    assert json_loads(out)["nested"] == {"a": [1, 2]}
+    assert json_loads(out)["big"] == 2**70
+
+    assert "2026" in json_dumps_compact({"ts": datetime(2026, 1, 1, tzinfo=timezone.utc)})